@@ -5,6 +5,7 @@ from lsprotocol.types import (
 )
 from lexer import Lexer
 from parser import Parser
+import parser_cache
 import re
 import os
 import json
@@ -100,11 +101,17 @@ def did_open(ls: LanguageServer, params: DidOpenTextDocumentParams):
         else:
             print("DEBUG: Lexer doesn't have diagnostics collection yet")
         
-        print(f"DEBUG: Creating parser")
-        parser = Parser(tokens)
-        print(f"DEBUG: Starting parsing")
-        ast = parser.parse()
-        print(f"DEBUG: Parsing successful")
+        ast = parser_cache.load(text)
+        if ast is None:
+            print(f"DEBUG: Creating parser")
+            parser = Parser(tokens, reuse_from=parser_cache.decl_cache(uri))
+            print(f"DEBUG: Starting parsing")
+            ast = parser.parse()
+            parser_cache.store(text, ast)
+            parser_cache.store_decl_cache(uri, parser.decl_cache)
+            print(f"DEBUG: Parsing successful")
+        else:
+            print(f"DEBUG: AST cache hit, parse skipped")
         
     except Exception as e:
         print(f"=== PARSE ERROR DEBUG ===")
@@ -195,9 +202,13 @@ async def show_ast(ls: LanguageServer, params):
         if hasattr(lexer, 'debug_filename'):
             lexer.debug_filename = filename
             
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
-        ast = parser.parse()
+        ast = parser_cache.load(text)
+        if ast is None:
+            tokens = lexer.tokenize()
+            parser = Parser(tokens, reuse_from=parser_cache.decl_cache(uri))
+            ast = parser.parse()
+            parser_cache.store(text, ast)
+            parser_cache.store_decl_cache(uri, parser.decl_cache)
         ast_str = json.dumps(ast.to_dict(), indent=2) if hasattr(ast, 'to_dict') else str(ast)
         return {"ast": ast_str}
     except Exception as e:
@@ -226,18 +237,21 @@ def load_library_files():
                 print(f"  Content length: {len(content)} characters")
                 print(f"  First 100 chars: {repr(content[:100])}")
                 
-                print("  Creating lexer...")
-                lexer = Lexer(content)
-                
-                print("  Starting tokenization...")
-                tokens = lexer.tokenize()
-                print(f"  Tokenization successful: {len(tokens)} tokens")
-                
-                print("  Creating parser...")
-                parser = Parser(tokens)
-                
-                print("  Starting parsing...")
-                result = parser.parse()
+                result = parser_cache.load(content)
+                if result is None:
+                    print("  Creating lexer...")
+                    lexer = Lexer(content)
+
+                    print("  Starting tokenization...")
+                    tokens = lexer.tokenize()
+                    print(f"  Tokenization successful: {len(tokens)} tokens")
+
+                    print("  Creating parser...")
+                    parser = Parser(tokens)
+
+                    print("  Starting parsing...")
+                    result = parser.parse()
+                    parser_cache.store(content, result)
                 print(f"✓ Successfully loaded {file}")
                 
             except Exception as e:
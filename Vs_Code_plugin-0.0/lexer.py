@@ -1,10 +1,17 @@
 # lexer.py - ENHANCED FOR SYSTEMS PROGRAMMING + TYPE FUSION
-from enum import Enum, auto
+import sys
+from enum import IntEnum, auto
 from dataclasses import dataclass
 from typing import List, Optional, Union, Any, Tuple
 import re
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # IntEnum so a member IS its ordinal: the parser's structure-of-arrays
+    # token layout and its mask/precedence tables index directly on token
+    # values. Members are auto()-numbered from 1 in declaration order, and
+    # the parser's tables are rebuilt from the enum at import, so appending
+    # new members is safe; reordering existing ones invalidates nothing at
+    # runtime but does churn any pickled AST caches keyed on the version.
     # Control Flow Keywords
     RUNTASK = auto()
     PRINTMESSAGE = auto()
@@ -1241,7 +1248,7 @@ class Lexer:
                 # Check if it's a valid type fusion pattern
                 if self.fusion_recognizer.is_valid_fusion_pattern(value):
                     # It's a fused type! Create a FUSEDTYPE token
-                    self.tokens.append(Token(TokenType.FUSEDTYPE, value, line_start, col_start, len(value)))
+                    self.tokens.append(Token(TokenType.FUSEDTYPE, sys.intern(value), line_start, col_start, len(value)))
                     
                     # Log successful fusion recognition
                     components = self.fusion_recognizer.get_fusion_components(value)
@@ -1260,7 +1267,10 @@ class Lexer:
                 
                 # If it's a keyword, use it as-is
                 if token_type != TokenType.IDENTIFIER:
-                    self.tokens.append(Token(token_type, value, line_start, col_start, len(value)))
+                    # Keyword spellings recur constantly; interning makes every
+                    # occurrence share one string object so downstream ==
+                    # checks against operator names are pointer compares.
+                    self.tokens.append(Token(token_type, sys.intern(value), line_start, col_start, len(value)))
                     continue
                 
                 # If it's an identifier, check for dots and continue reading
@@ -1271,7 +1281,7 @@ class Lexer:
                         parts.append(self.read_identifier())
                     value = '.'.join(parts)
                 
-                self.tokens.append(Token(TokenType.IDENTIFIER, value, line_start, col_start, len(value)))
+                self.tokens.append(Token(TokenType.IDENTIFIER, sys.intern(value), line_start, col_start, len(value)))
                 continue
                 
             # Handle dot as a separate token
@@ -1282,4 +1292,45 @@ class Lexer:
 
             self.error(f"Unknown character '{self.current_char()}'")
         self.tokens.append(Token(TokenType.EOF, None, self.line, self.column))
-        return self.tokens
\ No newline at end of file
+        self._fold_negative_literals()
+        return self.tokens
+
+    # Tokens after which a '-' can only start a negative literal - never a
+    # binary subtraction and never the name-value pair separator.
+    _NEG_FOLD_PREV = frozenset({
+        TokenType.LPAREN, TokenType.LBRACKET, TokenType.COMMA,
+        TokenType.EQUALS,
+    })
+
+    def _fold_negative_literals(self):
+        """Merge '-' + NUMBER into one signed NUMBER token where unambiguous.
+
+        Runs as a post-pass over the token stream: when a DASH/SUBTRACT is
+        preceded by a token that cannot end an expression and immediately
+        followed by a NUMBER, the pair collapses into a single NUMBER whose
+        value is negated and whose position is the minus sign's. The parser
+        then sees negative literals as plain numbers with no extra branch or
+        node allocation. Ambiguous spots (after identifiers, closing parens,
+        newlines) are left alone.
+        """
+        tokens = self.tokens
+        folded = []
+        append = folded.append
+        fold_prev = self._NEG_FOLD_PREV
+        i = 0
+        n = len(tokens)
+        while i < n:
+            tok = tokens[i]
+            if (tok.type in (TokenType.DASH, TokenType.SUBTRACT)
+                    and i + 1 < n
+                    and tokens[i + 1].type == TokenType.NUMBER
+                    and isinstance(tokens[i + 1].value, (int, float))
+                    and folded and folded[-1].type in fold_prev):
+                num = tokens[i + 1]
+                append(Token(TokenType.NUMBER, -num.value,
+                             tok.line, tok.column, num.length + 1))
+                i += 2
+                continue
+            append(tok)
+            i += 1
+        self.tokens = folded
\ No newline at end of file
@@ -1,8 +1,27 @@
 # parser.py - ENHANCED FOR SYSTEMS PROGRAMMING
+import logging
+import operator
+import sys
+from array import array
+from functools import wraps
 from typing import List, Optional, Tuple, Dict
 from lexer import TokenType, Token, LexerError
 from ailang_ast import *
 
+# Pre-bound aliases for the AST classes built on hot parse paths: LOAD_GLOBAL
+# on a short module-level name is cheaper than repeated lookups through the
+# star-imported namespace, and keeps the hot constructors easy to spot.
+_Number = Number
+_String = String
+_Boolean = Boolean
+_Identifier = Identifier
+_TypeExpression = TypeExpression
+_FunctionCall = FunctionCall
+_VMOperationCall = VMOperationCall
+_LowLevelType = LowLevelType
+
+log = logging.getLogger(__name__)
+
 
 class ParseError(Exception):
     def __init__(self, message: str, token: Optional[Token] = None):
@@ -13,177 +32,626 @@ class ParseError(Exception):
         else:
             super().__init__(f"Parse error: {message}")
 
+_EOF_NAME = "EOF"
+
+# Rule ids for the packrat memo table; one per memoized parse rule.
+_RULE_EXPRESSION = 0
+_RULE_PRIMARY = 1
+_RULE_TYPE = 2
+_RULE_STRICT_EXPRESSION = 3
+_RULE_PARENTHESIZED = 4
+_RULE_INFIX_BINARY = 5
+
+
+def memoize_rule(rule_id: int):
+    """Memoize a zero-argument parse rule by (rule_id, token position).
+
+    On a hit the parser jumps straight to the recorded end position and
+    returns the cached node, so backtracking callers never re-parse the same
+    span. Only worthwhile on rules that get re-entered (expressions, types);
+    exceptions are not cached, so error paths behave as before.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self):
+            key = (rule_id, self.position)
+            hit = self._memo.get(key)
+            if hit is not None:
+                node, end = hit
+                self.position = end
+                return node
+            result = fn(self)
+            self._memo[key] = (result, self.position)
+            return result
+        return wrapper
+    return decorator
+
+
+def memoize_rule_arg(rule_id: int):
+    """memoize_rule for one-argument rules; the argument joins the key.
+
+    Used by parse_infix_binary, where min_precedence changes what the rule
+    accepts at the same position.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, arg):
+            key = (rule_id, self.position, arg)
+            hit = self._memo.get(key)
+            if hit is not None:
+                node, end = hit
+                self.position = end
+                return node
+            result = fn(self, arg)
+            self._memo[key] = (result, self.position)
+            return result
+        return wrapper
+    return decorator
+
+
+def _type_name(token: Optional[Token]) -> str:
+    """Readable token-type name for error messages; tolerates end of stream."""
+    return token.type.name if token else _EOF_NAME
+
+
+# Tight integer loops over the type-ordinal array, lifted to module level so
+# they run on plain locals with no self lookups (and so the optional Cython
+# build compiles them as free functions).
+
+def _scan_while(types, pos: int, n: int, target: int) -> int:
+    """Advance pos past a run of tokens whose type ordinal equals target."""
+    while pos < n and types[pos] == target:
+        pos += 1
+    return pos
+
+
+def _match_at(types, pos: int, n: int, want) -> bool:
+    """True if the type ordinals in want appear consecutively at pos."""
+    for w in want:
+        if pos >= n or types[pos] != w:
+            return False
+        pos += 1
+    return True
+
+
+def _make_consumer(token_type: TokenType):
+    """Build a zero-argument consume() specialized to one token type.
+
+    The expected ordinal is baked into the closure, so the hot path is a
+    single integer compare with no argument passing or enum attribute load;
+    mismatches fall back to the generic consume() for its error reporting.
+    """
+    expected = token_type.value
+
+    def consumer(self) -> Token:
+        if self.position < self._n and self.types[self.position] == expected:
+            token = self.current_token
+            self.advance()
+            return token
+        return self.consume(token_type)
+
+    consumer.__name__ = f'consume_{token_type.name}'
+    return consumer
+
+
+def _scan_dotted(types, pos: int, n: int, ident: int, dot: int) -> int:
+    """End of an IDENT (DOT IDENT)* run; pos must sit on the leading IDENT."""
+    pos += 1
+    while pos + 1 < n and types[pos] == dot and types[pos + 1] == ident:
+        pos += 2
+    return pos
+
+
+_IDENTIFIER_VAL = TokenType.IDENTIFIER.value
+_DOT_VAL = TokenType.DOT.value
+_LPAREN_VAL = TokenType.LPAREN.value
+_EQUALS_VAL = TokenType.EQUALS.value
+_FUSEDTYPE_VAL = TokenType.FUSEDTYPE.value
+_LBRACE_VAL = TokenType.LBRACE.value
+_RBRACE_VAL = TokenType.RBRACE.value
+_RPAREN_VAL = TokenType.RPAREN.value
+_COMMA_VAL = TokenType.COMMA.value
+_RBRACKET_VAL = TokenType.RBRACKET.value
+_ARROW_RIGHT_VAL = TokenType.ARROW_RIGHT.value
+
+# Values of the named math constants; the tokens themselves carry no value,
+# so these are the single source for every PI/E/PHI literal node.
+_PI_VALUE = 3.141592653589793
+_E_VALUE = 2.718281828459045
+_PHI_VALUE = 1.618033988749895
+
+# Size in bytes and signedness of each low-level type literal.
+_LOWLEVEL_TYPE_INFO = {
+    'Byte': (1, False), 'Word': (2, False), 'DWord': (4, False), 'QWord': (8, False),
+    'UInt8': (1, False), 'UInt16': (2, False), 'UInt32': (4, False), 'UInt64': (8, False),
+    'Int8': (1, True), 'Int16': (2, True), 'Int32': (4, True), 'Int64': (8, True),
+}
+
+# Parse-time constant folding for the named math and boolean functions.
+# _FOLD_ARITH computes calls whose operands are all numeric literals
+# outright; _FOLD_IDENTITY holds the two-operand algebraic identities,
+# each a one-line rule so new identities slot in without touching
+# parse_math_function.
+_FOLD_ARITH = {
+    'Add': operator.add,
+    'Subtract': operator.sub,
+    'Multiply': operator.mul,
+    'Divide': operator.truediv,
+    'Power': operator.pow,
+    'Modulo': operator.mod,
+}
+
+
+def _fold_num(node, value=None):
+    """True if node is a plain numeric literal, optionally of one value."""
+    return (type(node) is Number and isinstance(node.value, (int, float))
+            and (value is None or node.value == value))
+
+
+def _fold_same_name(a, b):
+    """True if both operands are the same bare identifier."""
+    return type(a) is Identifier and type(b) is Identifier and a.name == b.name
+
+
+_FOLD_IDENTITY = {
+    'Add': lambda a, b: b if _fold_num(a, 0) else a if _fold_num(b, 0) else None,
+    'Subtract': lambda a, b: (a if _fold_num(b, 0)
+                              else Number(a.line, a.column, 0) if _fold_same_name(a, b)
+                              else None),
+    'Multiply': lambda a, b: (b if _fold_num(a, 1) else a if _fold_num(b, 1)
+                              else a if _fold_num(a, 0) else b if _fold_num(b, 0)
+                              else None),
+    'Power': lambda a, b: a if _fold_num(b, 1) else None,
+}
+
+_FOLD_BOOL = {
+    'And': all,
+    'Or': any,
+    'Not': lambda vals: not vals[0],
+}
+
+# Operator sets and precedence, shared by every parser instance.
+_BINARY_OPERATORS = frozenset({
+    TokenType.ADD, TokenType.SUBTRACT, TokenType.MULTIPLY, TokenType.DIVIDE,
+    TokenType.POWER, TokenType.GREATERTHAN, TokenType.LESSTHAN,
+    TokenType.GREATEREQUAL, TokenType.LESSEQUAL, TokenType.EQUALTO,
+    TokenType.NOTEQUAL, TokenType.AND, TokenType.OR,
+    TokenType.DASH,  # the actual minus operator
+})
+_UNARY_OPERATORS = frozenset({
+    TokenType.SUBTRACT, TokenType.ADD, TokenType.NOT,
+    TokenType.DASH,  # unary minus
+})
+_BINOP_VALUES = frozenset(t.value for t in _BINARY_OPERATORS)
+
+# Flat precedence table indexed by type ordinal; non-operators stay 0.
+_PRECEDENCE = [0] * (max(t.value for t in TokenType) + 1)
+for _t, _p in ((TokenType.OR, 1), (TokenType.AND, 2),
+               (TokenType.EQUALTO, 3), (TokenType.NOTEQUAL, 3),
+               (TokenType.LESSTHAN, 4), (TokenType.GREATERTHAN, 4),
+               (TokenType.LESSEQUAL, 4), (TokenType.GREATEREQUAL, 4),
+               (TokenType.ADD, 5), (TokenType.SUBTRACT, 5),
+               (TokenType.MULTIPLY, 6), (TokenType.DIVIDE, 6),
+               (TokenType.POWER, 7)):
+    _PRECEDENCE[_t.value] = _p
+del _t, _p
+
+# Fused classifier table: the binary-operator test and precedence fetch are
+# one indexed read. Non-operators hold -1, so a single compare against
+# min_precedence answers "is this a binary operator I may take here".
+_BINOP_PREC = [-1] * len(_PRECEDENCE)
+for _t in _BINARY_OPERATORS:
+    _BINOP_PREC[_t.value] = _PRECEDENCE[_t.value]
+del _t
+
+# FIRST sets as frozensets of type ordinals: membership is one hash probe
+# against self.types[self.position], with no argument tuple per check.
+_COMMENT_VALUES = frozenset({
+    TokenType.COMMENT.value, TokenType.DOC_COMMENT.value,
+    TokenType.COM_COMMENT.value, TokenType.TAG_COMMENT.value,
+})
+_INFIX_START_VALUES = frozenset({
+    TokenType.NUMBER.value, TokenType.IDENTIFIER.value,
+    TokenType.SUBTRACT.value,
+})
+_ARROW_VALUES = frozenset({
+    TokenType.ARROW_LEFT.value, TokenType.ARROW_RIGHT.value,
+    TokenType.ARROW_BIDIRECTIONAL.value,
+})
+
+
+def _make_mask(values) -> bytes:
+    """Build a bytes mask over type ordinals: mask[tt] is 1 for members.
+
+    bytes.__getitem__ is a single C-level indexed load, so these beat even
+    frozenset probes on the per-token hot paths. Ordinal 0 is unused by
+    TokenType (auto() starts at 1) and stays 0, which lets peek_type report
+    "past the end" as 0 and still index any mask safely.
+    """
+    mask = bytearray(len(_PRECEDENCE))
+    for v in values:
+        mask[v] = 1
+    return bytes(mask)
+
+
+_BINOP_MASK = _make_mask(_BINOP_VALUES)
+# Operators accepted in the parenthesized word-infix form "(2 Multiply 3)";
+# the symbolic '-' (DASH) spelling has never been accepted there.
+_PAREN_INFIX_OP_MASK = _make_mask(_BINOP_VALUES - {TokenType.DASH.value})
+# Tokens that legally continue a declaration past its closing brace:
+# 'LoopEnd name' after a loop body, ElseBlock after IfCondition,
+# CatchError/FinallyBlock after TryBlock. A span ending at the brace
+# match is not the whole declaration when one of these follows, so the
+# reuse cache must neither store nor match such spans - otherwise a
+# parse cached before the clause was appended would satisfy the
+# unchanged prefix and strand the clause token at top level.
+_DECL_CONTINUATION_MASK = _make_mask(frozenset({
+    TokenType.LOOPEND.value, TokenType.ELSEBLOCK.value,
+    TokenType.CATCHERROR.value, TokenType.FINALLYBLOCK.value,
+}))
+_UNARY_MASK = _make_mask(t.value for t in _UNARY_OPERATORS)
+_COMMENT_MASK = _make_mask(_COMMENT_VALUES)
+_INFIX_START_MASK = _make_mask(_INFIX_START_VALUES)
+_ARROW_MASK = _make_mask(_ARROW_VALUES)
+
+
 class Parser:
-    def __init__(self, tokens: List[Token], strict_math: bool = True):
-        self.tokens = tokens
+    BINARY_OPERATORS = _BINARY_OPERATORS
+    UNARY_OPERATORS = _UNARY_OPERATORS
+
+    def __init__(self, tokens: List[Token], strict_math: bool = True,
+                 reuse_from: Optional[dict] = None,
+                 fold_constants: bool = True):
+        # Newlines are pure separators in the grammar - every production just
+        # skips them - so filter them out once instead of paying a
+        # skip_newlines() call at every parse site.
+        kept = [t for t in tokens if t.type is not TokenType.NEWLINE]
+        # Structure-of-arrays token layout: the hot loop only ever probes the
+        # contiguous type-ordinal array; values and positions live in their
+        # own parallel arrays and full Token objects are rebuilt lazily at
+        # AST-construction and error sites.
+        self.types = array('H', (t.type.value for t in kept))
+        # Interning string values up front means every name, stage and
+        # attribute key stored into the AST shares one object per distinct
+        # spelling, and later dict lookups hit the identity fast path.
+        intern = sys.intern
+        self.values = [intern(t.value) if type(t.value) is str else t.value
+                       for t in kept]
+        self.lines = array('i', (t.line for t in kept))
+        self.columns = array('i', (t.column for t in kept))
+        self._n = len(kept)
+        # Matching-bracket tables: paren_match[i] / brace_match[i] hold the
+        # index of the paren or brace matching the one at i (or -1), from one
+        # linear scan with two stacks. Lookahead over a paren group is then
+        # O(1) jumps, and a brace span sizes its block body up front.
+        paren_match = array('i', [-1]) * self._n
+        brace_match = array('i', [-1]) * self._n
+        lparen = TokenType.LPAREN.value
+        rparen = TokenType.RPAREN.value
+        lbrace = TokenType.LBRACE.value
+        rbrace = TokenType.RBRACE.value
+        open_parens = []
+        open_braces = []
+        for i, tv in enumerate(self.types):
+            if tv == lparen:
+                open_parens.append(i)
+            elif tv == rparen and open_parens:
+                j = open_parens.pop()
+                paren_match[j] = i
+                paren_match[i] = j
+            elif tv == lbrace:
+                open_braces.append(i)
+            elif tv == rbrace and open_braces:
+                j = open_braces.pop()
+                brace_match[j] = i
+                brace_match[i] = j
+        self.paren_match = paren_match
+        self.brace_match = brace_match
         self.position = 0
-        self.current_token = self.tokens[0] if tokens else None
         self.strict_math = strict_math
+        # Off switch for parse-time constant folding, so a debugging session
+        # can see the tree exactly as written.
+        self.fold_constants = fold_constants
+        # Append-only context list plus a depth counter: pop_context is a
+        # decrement, and the real stack is only sliced out on parse errors.
         self.context_stack: List[str] = []
-        
-        self.BINARY_OPERATORS = {
-            TokenType.ADD, TokenType.SUBTRACT, TokenType.MULTIPLY, TokenType.DIVIDE, 
-            TokenType.POWER, TokenType.GREATERTHAN, TokenType.LESSTHAN, 
-            TokenType.GREATEREQUAL, TokenType.LESSEQUAL, TokenType.EQUALTO, 
-            TokenType.NOTEQUAL, TokenType.AND, TokenType.OR,
-            TokenType.DASH  # ADD THIS - it's the actual minus operator!
-        }
-        
-        self.UNARY_OPERATORS = {
-            TokenType.SUBTRACT, TokenType.ADD, TokenType.NOT,
-            TokenType.DASH  # ADD THIS TOO for unary minus
-        }
+        self._ctx_depth = 0
+        self._memo: Dict[Tuple[int, int], Tuple[ASTNode, int]] = {}
+        # Declaration-level reuse across parses: decl_cache maps a span key
+        # (length, start position, token-content hash) to the subtree built
+        # from that span. Feeding it back as reuse_from on the next parse of
+        # an edited file lets unchanged top-level declarations skip
+        # parse_declaration entirely.
+        self._reuse_from = reuse_from or {}
+        self.decl_cache: dict = {}
+        # Instance-bound copy of the class dispatch table, keyed by type
+        # ordinal: statement dispatch is one dict probe on the raw array
+        # value and a plain bound-method call.
+        self._stmt_dispatch = {tt.value: fn.__get__(self)
+                               for tt, fn in self._STMT_DISPATCH.items()}
 
     def push_context(self, context: str):
-        self.context_stack.append(context)
+        depth = self._ctx_depth
+        if depth == len(self.context_stack):
+            self.context_stack.append(context)
+        else:
+            self.context_stack[depth] = context
+        self._ctx_depth = depth + 1
 
     def pop_context(self):
-        if self.context_stack:
-            self.context_stack.pop()
+        if self._ctx_depth:
+            self._ctx_depth -= 1
 
     def get_context(self) -> str:
-        return " > ".join(self.context_stack) if self.context_stack else "top level"
-
-    def error(self, message: str):
+        active = self.context_stack[:self._ctx_depth]
+        return " > ".join(active) if active else "top level"
+
+    def error(self, message: str, *args):
+        # %-style args are only formatted here, on the failure path, so call
+        # sites never pay for string formatting while parsing succeeds.
+        if args:
+            message = message % args
         context = self.get_context()
         raise ParseError(f"In {context}: {message}", self.current_token)
 
+    def _token_at(self, pos: int) -> Optional[Token]:
+        """Rebuild the Token at pos from the parallel arrays."""
+        if pos >= self._n:
+            return None
+        return Token(TokenType(self.types[pos]), self.values[pos],
+                     self.lines[pos], self.columns[pos])
+
+    @property
+    def current_token(self) -> Optional[Token]:
+        # Materialized on demand: the hot path probes self.types, so the full
+        # Token object is only built at AST-construction and error sites.
+        return self._token_at(self.position)
+
     def advance(self):
-        if self.position < len(self.tokens) - 1:
+        if self.position < self._n - 1:
             self.position += 1
-            self.current_token = self.tokens[self.position]
 
     def peek(self, offset: int = 1) -> Optional[Token]:
+        return self._token_at(self.position + offset)
+
+    def peek_type(self, offset: int = 1) -> int:
+        """Type ordinal at position + offset (0 past the end).
+
+        Lookahead that only needs the type reads the SoA array directly
+        instead of rebuilding a Token via peek(). The past-the-end value 0
+        is not a TokenType ordinal and indexes every mask table safely.
+        """
         pos = self.position + offset
-        if pos < len(self.tokens):
-            return self.tokens[pos]
-        return None
+        return self.types[pos] if pos < self._n else 0
 
-    def match(self, *token_types: TokenType) -> bool:
-        return self.current_token and self.current_token.type in token_types
+    def match(self, token_type: TokenType) -> bool:
+        # Deliberately single-argument: no *args tuple per call, and the
+        # monomorphic shape lets specializing interpreters inline it. Sets
+        # of alternatives are mask probes (_BINOP_MASK and friends), not
+        # match() calls.
+        return self._n != 0 and self.types[self.position] == token_type.value
 
     def match_sequence(self, *token_types: TokenType) -> bool:
-        for i, token_type in enumerate(token_types):
-            token = self.peek(i) if i > 0 else self.current_token
-            if not token or token.type != token_type:
-                return False
-        return True
+        return _match_at(self.types, self.position, self._n,
+                         [t.value for t in token_types])
 
     def consume(self, token_type: TokenType, message: str = "") -> Token:
-        if not self.current_token:
-            self.error(f"Expected {token_type.name} but reached end of file. {message}")
-        if self.current_token.type != token_type:
-            self.error(f"Expected {token_type.name}, got {self.current_token.type.name}. {message}")
-        token = self.current_token
+        # One array probe decides success; the Token object and the enum
+        # round-trip for error text are only built when they are needed.
+        pos = self.position
+        if pos >= self._n:
+            self.error("Expected %s but reached end of file. %s", token_type.name, message)
+        if self.types[pos] != token_type.value:
+            self.error("Expected %s, got %s. %s", token_type.name,
+                       TokenType(self.types[pos]).name, message)
+        token = self._token_at(pos)
         self.advance()
         return token
 
-    def skip_newlines(self):
-        while self.match(TokenType.NEWLINE):
-            self.advance()
+    def _parse_braced_block(self, context: Optional[str] = None) -> List[ASTNode]:
+        """Parse 'LBRACE statement* RBRACE' into a statement list.
+
+        The one shared body loop behind every brace-scoped block, with the
+        hot lookups bound to locals once per block. The body list is
+        pre-sized from the brace span so long blocks never pay append's
+        reallocation amortization.
+        """
+        # Rough statement-count estimate: the matching brace bounds the
+        # block's token span, and statements average a handful of tokens.
+        open_pos = self.position
+        close = self.brace_match[open_pos]
+        estimate = (close - open_pos) // 8 if close > open_pos else 0
+        self.consume_LBRACE()
+        if context is not None:
+            self.push_context(context)
+        body: List[ASTNode] = [None] * estimate
+        count = 0
+        types = self.types
+        pstmt = self.parse_statement
+        body_append = body.append
+        while types[self.position] != _RBRACE_VAL:
+            stmt = pstmt()
+            if stmt:
+                if count < estimate:
+                    body[count] = stmt
+                else:
+                    body_append(stmt)
+                count += 1
+        del body[count:]
+        self.consume_RBRACE()
+        if context is not None:
+            self.pop_context()
+        return body
+
+    def _decl_span_key(self, start: int, end: int) -> tuple:
+        """Reuse-cache key for the declaration spanning tokens [start, end).
+
+        Keyed on the span's token content plus its anchor line and column, so
+        a declaration whose text or position changed can never satisfy the
+        lookup with a stale subtree.
+        """
+        return (end - start, self.lines[start], self.columns[start],
+                hash((self.types[start:end].tobytes(),
+                      tuple(self.values[start:end]))))
 
     def parse(self) -> Program:
+        # Fresh memo per parse: positions from a previous run on a different
+        # token stream must never satisfy lookups in this one.
+        self._memo.clear()
         self.push_context("program")
         declarations = []
-        self.skip_newlines()
+        declarations_append = declarations.append
+        reuse = self._reuse_from
+        decl_cache = self.decl_cache
         while not self.match(TokenType.EOF):
-            self.skip_newlines()
             if self.match(TokenType.EOF):
                 break
-            if self.match(TokenType.COMMENT, TokenType.DOC_COMMENT, TokenType.COM_COMMENT, TokenType.TAG_COMMENT):
+            if _COMMENT_MASK[self.types[self.position]]:
                 self.advance()
                 continue
+            start = self.position
+            if reuse:
+                # Candidate span: a top-level declaration normally runs to
+                # the brace matching its first LBRACE. A wrong guess (e.g. a
+                # braceless Constant) just misses the cache and parses
+                # normally.
+                types = self.types
+                lb = -1
+                for i in range(start, min(start + 64, self._n)):
+                    if types[i] == _LBRACE_VAL:
+                        lb = i
+                        break
+                close = self.brace_match[lb] if lb >= 0 else -1
+                if (close > lb >= 0
+                        and not _DECL_CONTINUATION_MASK[types[close + 1]
+                                                        if close + 1 < self._n else 0]):
+                    key = self._decl_span_key(start, close + 1)
+                    hit = reuse.get(key)
+                    if hit is not None:
+                        decl_cache[key] = hit
+                        declarations_append(hit)
+                        self.position = close + 1
+                        continue
             decl = self.parse_declaration()
             if decl:
-                declarations.append(decl)
-            self.skip_newlines()
+                declarations_append(decl)
+                end = self.position
+                # Only brace-terminated spans are cached; their extent can
+                # be re-derived from the brace table on the next parse. A
+                # span whose next token could extend it (LoopEnd, ElseBlock,
+                # CatchError, FinallyBlock) is not cached at all: its brace
+                # match does not bound the declaration.
+                if (end > start and self.types[end - 1] == _RBRACE_VAL
+                        and not (end < self._n
+                                 and _DECL_CONTINUATION_MASK[self.types[end]])):
+                    decl_cache[self._decl_span_key(start, end)] = decl
         self.pop_context()
-        return Program(declarations=declarations, line=1, column=1)
+        return Program(1, 1, declarations)
+
+    # Token type -> bound-method name; dispatch is one dict probe instead of
+    # walking a ~20-branch elif chain per declaration.
+    _DECL_DISPATCH = {
+        TokenType.LIBRARYIMPORT: 'parse_library',
+        TokenType.FIXEDPOOL: 'parse_pool',
+        TokenType.DYNAMICPOOL: 'parse_pool',
+        TokenType.TEMPORALPOOL: 'parse_pool',
+        TokenType.NEURALPOOL: 'parse_pool',
+        TokenType.KERNELPOOL: 'parse_pool',
+        TokenType.ACTORPOOL: 'parse_pool',
+        TokenType.SECURITYPOOL: 'parse_pool',
+        TokenType.CONSTRAINEDPOOL: 'parse_pool',
+        TokenType.FILEPOOL: 'parse_pool',
+        TokenType.LOOPMAIN: 'parse_loop',
+        TokenType.LOOPACTOR: 'parse_loop',
+        TokenType.LOOPSTART: 'parse_loop',
+        TokenType.LOOPSHADOW: 'parse_loop',
+        TokenType.SUBROUTINE: 'parse_subroutine',
+        TokenType.FUNCTION: 'parse_function',
+        TokenType.COMBINATOR: 'parse_combinator',
+        TokenType.MACROBLOCK: 'parse_macro_block',
+        TokenType.SECURITYCONTEXT: 'parse_security_context',
+        TokenType.CONSTRAINEDTYPE: 'parse_constrained_type',
+        TokenType.CONSTANT: 'parse_constant',
+        # === Low-Level Declarations ===
+        TokenType.INTERRUPTHANDLER: 'parse_interrupt_handler',
+        TokenType.DEVICEDRIVER: 'parse_device_driver',
+        TokenType.BOOTLOADER: 'parse_bootloader_code',
+        TokenType.KERNELENTRY: 'parse_kernel_entry',
+    }
 
     def parse_declaration(self) -> Optional[ASTNode]:
-        if self.match(TokenType.LIBRARYIMPORT):
-            return self.parse_library()
-        elif self.match(TokenType.IDENTIFIER) and self.current_token.value == "AcronymDefinitions":
-            return self.parse_acronym_definitions()
-        elif self.match(TokenType.FIXEDPOOL, TokenType.DYNAMICPOOL, TokenType.TEMPORALPOOL,
-                       TokenType.NEURALPOOL, TokenType.KERNELPOOL, TokenType.ACTORPOOL,
-                       TokenType.SECURITYPOOL, TokenType.CONSTRAINEDPOOL, TokenType.FILEPOOL):
-            return self.parse_pool()
-        elif self.match(TokenType.LOOPMAIN, TokenType.LOOPACTOR, TokenType.LOOPSTART,
-                       TokenType.LOOPSHADOW):
-            return self.parse_loop()
-        elif self.match(TokenType.SUBROUTINE):
-            return self.parse_subroutine()
-        elif self.match(TokenType.FUNCTION):
-            return self.parse_function()
-        elif self.match(TokenType.COMBINATOR):
-            return self.parse_combinator()
-        elif self.match(TokenType.MACROBLOCK):
-            return self.parse_macro_block()
-        elif self.match(TokenType.SECURITYCONTEXT):
-            return self.parse_security_context()
-        elif self.match(TokenType.CONSTRAINEDTYPE):
-            return self.parse_constrained_type()
-        elif self.match(TokenType.CONSTANT):
-            return self.parse_constant()
-        # === NEW: Low-Level Declaration Parsing ===
-        elif self.match(TokenType.INTERRUPTHANDLER):
-            return self.parse_interrupt_handler()
-        elif self.match(TokenType.DEVICEDRIVER):
-            return self.parse_device_driver()
-        elif self.match(TokenType.BOOTLOADER):
-            return self.parse_bootloader_code()
-        elif self.match(TokenType.KERNELENTRY):
-            return self.parse_kernel_entry()
-        else:
-            stmt = self.parse_statement()
-            if stmt:
-                return stmt
-            if self.current_token:
-                self.error(f"Unexpected token '{self.current_token.value}' at top level")
-            return None
+        token = self.current_token
+        if token is not None:
+            if token.type is TokenType.IDENTIFIER and token.value == "AcronymDefinitions":
+                return self.parse_acronym_definitions()
+            handler = self._DECL_DISPATCH.get(token.type)
+            if handler is not None:
+                return handler(self)
+        stmt = self.parse_statement()
+        if stmt:
+            return stmt
+        if self.current_token:
+            self.error("Unexpected token '%s' at top level", self.current_token.value)
+        return None
 
     def parse_library(self) -> Library:
-        self.push_context("library")
-        start_token = self.consume(TokenType.LIBRARYIMPORT)
-        name = self.parse_dotted_name()
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        body = []
-        while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
-            if self.match(TokenType.LIBRARYIMPORT):
-                body.append(self.parse_library())
+        # Nested LibraryImport blocks are driven by an explicit frame stack
+        # instead of recursion: each level costs one (name, line, column,
+        # body) entry rather than a Python call frame.
+        stack: list = []
+
+        def open_library():
+            self.push_context("library")
+            start_token = self.consume_LIBRARYIMPORT()
+            name = self.parse_dotted_name()
+            self.consume_LBRACE()
+            stack.append((name, start_token.line, start_token.column, []))
+
+        open_library()
+        while True:
+            if self.match(TokenType.RBRACE):
+                self.consume_RBRACE()
+                self.pop_context()
+                name, line, column, body = stack.pop()
+                node = Library(line, column, name, body)
+                if not stack:
+                    return node
+                stack[-1][3].append(node)
+            elif self.match(TokenType.LIBRARYIMPORT):
+                open_library()
             elif self.match(TokenType.FUNCTION):
-                body.append(self.parse_function())
+                stack[-1][3].append(self.parse_function())
             elif self.match(TokenType.CONSTANT):
-                body.append(self.parse_constant())
+                stack[-1][3].append(self.parse_constant())
+            elif self.match(TokenType.EOF):
+                self.error("Unterminated LibraryImport block")
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return Library(name=name, body=body, line=start_token.line, column=start_token.column)
 
     def parse_dotted_name(self) -> str:
-        parts = [self.consume(TokenType.IDENTIFIER).value]
-        while self.match(TokenType.DOT) and self.peek() and self.peek().type == TokenType.IDENTIFIER:
-                parts.append(self.consume(TokenType.IDENTIFIER).value)
-        return '.'.join(parts)
+        start = self.position
+        self.consume_IDENTIFIER()
+        end = _scan_dotted(self.types, start, self._n,
+                           _IDENTIFIER_VAL, _DOT_VAL)
+        self.position = end
+        if end - start == 1:
+            # Single-part name: the token value is already interned.
+            return self.values[start]
+        # Every other slot in the run is an IDENTIFIER value. Interning the
+        # joined spelling means each distinct dotted name is one shared
+        # string however many times it appears, and downstream dict lookups
+        # on it hit the identity fast path.
+        return sys.intern('.'.join(self.values[start:end:2]))
 
     def parse_pool(self) -> Pool:
         pool_type_token = self.current_token
-        pool_type = pool_type_token.value
+        pool_type = pool_type_token.value  # interned in __init__
         self.advance()
         self.push_context(f"{pool_type}")
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        name = self.consume_IDENTIFIER().value
+        self.consume_LBRACE()
         body = []
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.SUBPOOL):
                 body.append(self.parse_subpool())
             elif self.match(TokenType.STRING):
@@ -191,106 +659,86 @@ class Parser:
                 body.append(item)
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
+        self.consume_RBRACE()
         self.pop_context()
-        return Pool(pool_type=pool_type, name=name, body=body,
-                    line=pool_type_token.line, column=pool_type_token.column)
+        return Pool(pool_type_token.line, pool_type_token.column, pool_type, name, body)
 
     def parse_subpool(self) -> SubPool:
-        start_token = self.consume(TokenType.SUBPOOL)
-        name = self.consume(TokenType.IDENTIFIER).value
+        start_token = self.consume_SUBPOOL()
+        name = self.consume_IDENTIFIER().value
         self.push_context(f"SubPool.{name}")
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LBRACE()
         items = {}
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.STRING):
                 item = self.parse_resource_item()
                 items[item.key] = item
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
+        self.consume_RBRACE()
         self.pop_context()
-        return SubPool(name=name, items=items, line=start_token.line, column=start_token.column)
+        return SubPool(start_token.line, start_token.column, name, items)
+
+    # Attribute keyword -> (attribute key, parse-method name); resolved to
+    # plain functions at module bottom like the dispatch tables above.
+    _RES_ATTR_MAP = {
+        TokenType.CANCHANGE: ('CanChange', 'parse_primary'),
+        TokenType.CANBENULL: ('CanBeNull', 'parse_primary'),
+        TokenType.RANGE: ('Range', 'parse_array_literal'),
+        TokenType.MAXIMUMLENGTH: ('MaximumLength', 'parse_primary'),
+        TokenType.MINIMUMLENGTH: ('MinimumLength', 'parse_primary'),
+        TokenType.ELEMENTTYPE: ('ElementType', 'parse_type'),
+    }
 
     def parse_resource_item(self) -> ResourceItem:
-        key = self.consume(TokenType.STRING).value
-        self.consume(TokenType.COLON)
+        key = self.consume_STRING().value
+        self.consume_COLON()
         value = None
         attributes = {}
         if self.match(TokenType.INITIALIZE):
-            self.consume(TokenType.INITIALIZE)
-            self.consume(TokenType.DASH)
+            self.consume_INITIALIZE()
+            self.consume_DASH()
             value = self.parse_primary()
         while self.match(TokenType.COMMA):
-            self.consume(TokenType.COMMA)
-            self.skip_newlines()
-            if self.match(TokenType.CANCHANGE):
-                self.consume(TokenType.CANCHANGE)
-                self.consume(TokenType.DASH)
-                attributes['CanChange'] = self.parse_primary()
-            elif self.match(TokenType.CANBENULL):
-                self.consume(TokenType.CANBENULL)
-                self.consume(TokenType.DASH)
-                attributes['CanBeNull'] = self.parse_primary()
-            elif self.match(TokenType.RANGE):
-                self.consume(TokenType.RANGE)
-                self.consume(TokenType.DASH)
-                attributes['Range'] = self.parse_array_literal()
-            elif self.match(TokenType.MAXIMUMLENGTH):
-                self.consume(TokenType.MAXIMUMLENGTH)
-                self.consume(TokenType.DASH)
-                attributes['MaximumLength'] = self.parse_primary()
-            elif self.match(TokenType.MINIMUMLENGTH):
-                self.consume(TokenType.MINIMUMLENGTH)
-                self.consume(TokenType.DASH)
-                attributes['MinimumLength'] = self.parse_primary()
-            elif self.match(TokenType.ELEMENTTYPE):
-                self.consume(TokenType.ELEMENTTYPE)
-                self.consume(TokenType.DASH)
-                attributes['ElementType'] = self.parse_type()
+            self.consume_COMMA()
+            entry = self._RES_ATTR_MAP.get(self.current_token.type)
+            if entry is not None:
+                attr_key, parse_value = entry
+                self.advance()
+                self.consume_DASH()
+                attributes[attr_key] = parse_value(self)
+            elif self.match(TokenType.IDENTIFIER):
+                attr_name = self.consume_IDENTIFIER().value
+                self.consume_DASH()
+                attributes[attr_name] = self.parse_expression()
             else:
-                if self.match(TokenType.IDENTIFIER):
-                    attr_name = self.consume(TokenType.IDENTIFIER).value
-                    self.consume(TokenType.DASH)
-                    attributes[attr_name] = self.parse_expression()
-                else:
-                    break
-        return ResourceItem(key=key, value=value, attributes=attributes,
-                            line=self.current_token.line, column=self.current_token.column)
+                break
+        return ResourceItem(self.lines[self.position], self.columns[self.position], key, value, attributes)
 
     # === NEW: Low-Level Parsing Methods ===
 
     def parse_interrupt_handler(self) -> InterruptHandler:
         """Parse interrupt handler declaration with pool-like syntax"""
-        start_token = self.consume(TokenType.INTERRUPTHANDLER)
-        handler_name = self.consume(TokenType.IDENTIFIER).value
+        start_token = self.consume_INTERRUPTHANDLER()
+        handler_name = self.consume_IDENTIFIER().value
         
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LBRACE()
         
-        # Parse resource items (like pool syntax)
-        handler_config = {}
+        # Parse resource items (like pool syntax); entries collect into a
+        # list and the dict is built in one shot, avoiding resize churn.
+        entries = []
+        entries_append = entries.append
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
-            if self.match(TokenType.RBRACE):
-                break
-                
             # Parse resource item: "key": Initialize-value, attributes...
             if self.match(TokenType.STRING):
                 item = self.parse_resource_item()
-                handler_config[item.key] = item
+                entries_append((item.key, item))
             else:
                 # Skip unexpected tokens
                 self.advance()
-            self.skip_newlines()
-        
-        self.consume(TokenType.RBRACE)
+        handler_config = dict(entries)
+
+        self.consume_RBRACE()
         
         # Extract vector from config (required)
         vector = None
@@ -302,414 +750,302 @@ class Parser:
         # Build body from configuration items (for compatibility)
         body = list(handler_config.values())
         
-        return InterruptHandler(
-            handler_type="interrupt",
-            vector=vector,
-            handler_name=handler_name,
-            body=body,
-            line=start_token.line,
-            column=start_token.column
-        )
+        return InterruptHandler(start_token.line, start_token.column, 'interrupt', vector, handler_name, body)
 
     def parse_device_driver(self) -> DeviceDriver:
         """Parse device driver declaration"""
-        start_token = self.consume(TokenType.DEVICEDRIVER)
-        driver_name = self.consume(TokenType.IDENTIFIER).value
+        start_token = self.consume_DEVICEDRIVER()
+        driver_name = self.consume_IDENTIFIER().value
         
         # Parse device type
-        self.consume(TokenType.COLON)
-        device_type = self.consume(TokenType.IDENTIFIER).value
+        self.consume_COLON()
+        device_type = self.consume_IDENTIFIER().value
         
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LBRACE()
         
-        # Parse driver operations
-        operations = {}
+        # Parse driver operations as (name, handler) pairs, built into a
+        # dict in one shot after the loop.
+        entries = []
+        entries_append = entries.append
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.IDENTIFIER):
-                op_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.COLON)
-                operations[op_name] = self.parse_expression()
+                op_name = self.consume_IDENTIFIER().value
+                self.consume_COLON()
+                entries_append((op_name, self.parse_expression()))
             else:
                 self.advance()
-            self.skip_newlines()
-        
-        self.consume(TokenType.RBRACE)
-        return DeviceDriver(
-            driver_name=driver_name,
-            device_type=device_type,
-            operations=operations,
-            line=start_token.line,
-            column=start_token.column
-        )
+        operations = dict(entries)
+
+        self.consume_RBRACE()
+        return DeviceDriver(start_token.line, start_token.column, driver_name, device_type, operations)
 
     def parse_bootloader_code(self) -> BootloaderCode:
         """Parse bootloader code block"""
-        start_token = self.consume(TokenType.BOOTLOADER)
-        stage = self.consume(TokenType.IDENTIFIER).value
-        
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        start_token = self.consume_BOOTLOADER()
+        stage = self.consume_IDENTIFIER().value
         
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        
-        self.consume(TokenType.RBRACE)
-        return BootloaderCode(
-            stage=stage,
-            body=body,
-            line=start_token.line,
-            column=start_token.column
-        )
+        body = self._parse_braced_block()
+        return BootloaderCode(start_token.line, start_token.column, stage, body)
 
     def parse_kernel_entry(self) -> KernelEntry:
         """Parse kernel entry point"""
-        start_token = self.consume(TokenType.KERNELENTRY)
-        entry_name = self.consume(TokenType.IDENTIFIER).value
+        start_token = self.consume_KERNELENTRY()
+        entry_name = self.consume_IDENTIFIER().value
         
         # Optional parameters
         parameters = []
         if self.match(TokenType.LPAREN):
-            self.consume(TokenType.LPAREN)
+            self.consume_LPAREN()
             while not self.match(TokenType.RPAREN):
-                param_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.COLON)
+                param_name = self.consume_IDENTIFIER().value
+                self.consume_COLON()
                 param_type = self.parse_type()
                 parameters.append((param_name, param_type))
                 if self.match(TokenType.COMMA):
-                    self.consume(TokenType.COMMA)
-                    self.skip_newlines()
-            self.consume(TokenType.RPAREN)
-        
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
+                    self.consume_COMMA()
+            self.consume_RPAREN()
         
-        self.consume(TokenType.RBRACE)
-        return KernelEntry(
-            entry_name=entry_name,
-            parameters=parameters,
-            body=body,
-            line=start_token.line,
-            column=start_token.column
-        )
+        body = self._parse_braced_block()
+        return KernelEntry(start_token.line, start_token.column, entry_name, parameters, body)
 
     def parse_loop(self) -> Loop:
         loop_type_token = self.current_token
-        loop_type = loop_type_token.value
+        loop_type = loop_type_token.value  # interned in __init__
         self.advance()
         self.push_context(f"{loop_type}")
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.skip_newlines()
+        name = self.consume_IDENTIFIER().value
+        body = self._parse_braced_block()
         end_name = None
         if self.match(TokenType.LOOPEND):
-            self.consume(TokenType.LOOPEND)
-            end_name = self.consume(TokenType.IDENTIFIER).value
+            self.consume_LOOPEND()
+            end_name = self.consume_IDENTIFIER().value
         self.pop_context()
-        return Loop(loop_type=loop_type, name=name, body=body, end_name=end_name,
-                    line=loop_type_token.line, column=loop_type_token.column)
+        return Loop(loop_type_token.line, loop_type_token.column, loop_type, name, body, end_name)
 
     def parse_subroutine(self) -> SubRoutine:
-        start_token = self.consume(TokenType.SUBROUTINE)
+        start_token = self.consume_SUBROUTINE()
         name = self.parse_dotted_name()
-        self.push_context(f"SubRoutine.{name}")
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return SubRoutine(name=name, body=body, line=start_token.line, column=start_token.column)
+        body = self._parse_braced_block(f"SubRoutine.{name}")
+        return SubRoutine(start_token.line, start_token.column, name, body)
 
     def parse_function(self) -> Function:
-        start_token = self.consume(TokenType.FUNCTION)
+        start_token = self.consume_FUNCTION()
         name = self.parse_dotted_name()
         self.push_context(f"Function.{name}")
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LBRACE()
         input_params = []
         output_type = None
         body = []
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.INPUT):
-                self.consume(TokenType.INPUT)
-                self.consume(TokenType.COLON)
+                self.consume_INPUT()
+                self.consume_COLON()
                 if self.match(TokenType.LPAREN):
-                    self.consume(TokenType.LPAREN)
+                    self.consume_LPAREN()
                     while not self.match(TokenType.RPAREN):
-                        param_name = self.consume(TokenType.IDENTIFIER).value
-                        self.consume(TokenType.COLON)
+                        param_name = self.consume_IDENTIFIER().value
+                        self.consume_COLON()
                         param_type = self.parse_type()
                         input_params.append((param_name, param_type))
                         if self.match(TokenType.COMMA):
-                            self.consume(TokenType.COMMA)
-                            self.skip_newlines()
-                    self.consume(TokenType.RPAREN)
+                            self.consume_COMMA()
+                    self.consume_RPAREN()
                 else:
-                    param_name = self.consume(TokenType.IDENTIFIER).value
-                    self.consume(TokenType.COLON)
+                    param_name = self.consume_IDENTIFIER().value
+                    self.consume_COLON()
                     param_type = self.parse_type()
                     input_params.append((param_name, param_type))
             elif self.match(TokenType.OUTPUT):
-                self.consume(TokenType.OUTPUT)
-                self.consume(TokenType.COLON)
+                self.consume_OUTPUT()
+                self.consume_COLON()
                 output_type = self.parse_type()
             elif self.match(TokenType.BODY):
-                self.consume(TokenType.BODY)
-                self.consume(TokenType.COLON)
-                self.skip_newlines()
-                self.consume(TokenType.LBRACE)
-                self.skip_newlines()
-                while not self.match(TokenType.RBRACE):
-                    stmt = self.parse_statement()
-                    if stmt:
-                        body.append(stmt)
-                    self.skip_newlines()
-                self.consume(TokenType.RBRACE)
+                self.consume_BODY()
+                self.consume_COLON()
+                body = self._parse_braced_block()
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
+        self.consume_RBRACE()
         self.pop_context()
-        return Function(name=name, input_params=input_params, output_type=output_type,
-                        body=body, line=start_token.line, column=start_token.column)
+        return Function(start_token.line, start_token.column, name, input_params, output_type, body)
 
     def parse_lambda(self) -> Lambda:
-        start_token = self.consume(TokenType.LAMBDA)
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_LAMBDA()
+        self.consume_LPAREN()
         params = []
         while not self.match(TokenType.RPAREN):
-            params.append(self.consume(TokenType.IDENTIFIER).value)
+            params.append(self.consume_IDENTIFIER().value)
             if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        self.consume(TokenType.RPAREN)
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+                self.consume_COMMA()
+        self.consume_RPAREN()
+        self.consume_LBRACE()
         body = self.parse_expression()
-        self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        return Lambda(params=params, body=body, line=start_token.line, column=start_token.column)
+        self.consume_RBRACE()
+        return Lambda(start_token.line, start_token.column, params, body)
 
     def parse_combinator(self) -> Combinator:
-        start_token = self.consume(TokenType.COMBINATOR)
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.EQUALS)
-        self.skip_newlines()
+        start_token = self.consume_COMBINATOR()
+        name = self.consume_IDENTIFIER().value
+        self.consume_EQUALS()
         definition = self.parse_expression()
-        return Combinator(name=name, definition=definition,
-                         line=start_token.line, column=start_token.column)
+        return Combinator(start_token.line, start_token.column, name, definition)
 
     def parse_macro_block(self) -> MacroBlock:
-        start_token = self.consume(TokenType.MACROBLOCK)
+        start_token = self.consume_MACROBLOCK()
         name = self.parse_dotted_name()
         self.push_context(f"MacroBlock.{name}")
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LBRACE()
         macros = {}
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.MACRO):
                 macro = self.parse_macro_definition()
                 macros[macro.name] = macro
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
+        self.consume_RBRACE()
         self.pop_context()
-        return MacroBlock(name=name, macros=macros,
-                         line=start_token.line, column=start_token.column)
+        return MacroBlock(start_token.line, start_token.column, name, macros)
 
     def parse_macro_definition(self) -> MacroDefinition:
-        start_token = self.consume(TokenType.MACRO)
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_MACRO()
+        name = self.consume_IDENTIFIER().value
+        self.consume_LPAREN()
         params = []
         while not self.match(TokenType.RPAREN):
-            params.append(self.consume(TokenType.IDENTIFIER).value)
+            params.append(self.consume_IDENTIFIER().value)
             if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        self.consume(TokenType.RPAREN)
-        self.consume(TokenType.EQUALS)
-        self.skip_newlines()
+                self.consume_COMMA()
+        self.consume_RPAREN()
+        self.consume_EQUALS()
         body = self.parse_expression()
-        return MacroDefinition(name=name, params=params, body=body,
-                             line=start_token.line, column=start_token.column)
+        return MacroDefinition(start_token.line, start_token.column, name, params, body)
 
     def parse_security_context(self) -> SecurityContext:
-        start_token = self.consume(TokenType.SECURITYCONTEXT)
-        name = self.consume(TokenType.IDENTIFIER).value
+        start_token = self.consume_SECURITYCONTEXT()
+        name = self.consume_IDENTIFIER().value
         self.push_context(f"SecurityContext.{name}")
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LBRACE()
         levels = {}
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.LEVEL):
                 level = self.parse_security_level()
                 levels[level.name] = level
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
+        self.consume_RBRACE()
         self.pop_context()
-        return SecurityContext(name=name, levels=levels,
-                             line=start_token.line, column=start_token.column)
+        return SecurityContext(start_token.line, start_token.column, name, levels)
 
     def parse_security_level(self) -> SecurityLevel:
-        self.consume(TokenType.LEVEL)
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.EQUALS)
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_LEVEL()
+        name = self.consume_IDENTIFIER().value
+        self.consume_EQUALS()
+        self.consume_LBRACE()
         allowed_operations = []
         denied_operations = []
         memory_limit = None
         cpu_quota = None
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
             if self.match(TokenType.ALLOWEDOPERATIONS):
-                self.consume(TokenType.ALLOWEDOPERATIONS)
-                self.consume(TokenType.COLON)
+                self.consume_ALLOWEDOPERATIONS()
+                self.consume_COLON()
                 allowed_operations = self.parse_string_array()
             elif self.match(TokenType.DENIEDOPERATIONS):
-                self.consume(TokenType.DENIEDOPERATIONS)
-                self.consume(TokenType.COLON)
+                self.consume_DENIEDOPERATIONS()
+                self.consume_COLON()
                 denied_operations = self.parse_string_array()
             elif self.match(TokenType.MEMORYLIMIT):
-                self.consume(TokenType.MEMORYLIMIT)
-                self.consume(TokenType.COLON)
+                self.consume_MEMORYLIMIT()
+                self.consume_COLON()
                 memory_limit = self.parse_expression()
             elif self.match(TokenType.CPUQUOTA):
-                self.consume(TokenType.CPUQUOTA)
-                self.consume(TokenType.COLON)
+                self.consume_CPUQUOTA()
+                self.consume_COLON()
                 cpu_quota = self.parse_expression()
             else:
                 self.advance()
             if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        return SecurityLevel(name=name, allowed_operations=allowed_operations,
-                             denied_operations=denied_operations,
-                             memory_limit=memory_limit, cpu_quota=cpu_quota,
-                             line=self.current_token.line, column=self.current_token.column)
+                self.consume_COMMA()
+        self.consume_RBRACE()
+        return SecurityLevel(self.lines[self.position], self.columns[self.position], name, allowed_operations, denied_operations, memory_limit, cpu_quota)
 
     def parse_constrained_type(self) -> ConstrainedType:
-        start_token = self.consume(TokenType.CONSTRAINEDTYPE)
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.EQUALS)
+        start_token = self.consume_CONSTRAINEDTYPE()
+        name = self.consume_IDENTIFIER().value
+        self.consume_EQUALS()
         base_type = self.parse_type()
-        self.consume(TokenType.WHERE)
-        self.consume(TokenType.LBRACE)
+        self.consume_WHERE()
+        self.consume_LBRACE()
         constraints = self.parse_expression()
-        self.consume(TokenType.RBRACE)
-        return ConstrainedType(name=name, base_type=base_type, constraints=constraints,
-                               line=start_token.line, column=start_token.column)
+        self.consume_RBRACE()
+        return ConstrainedType(start_token.line, start_token.column, name, base_type, constraints)
 
     def parse_constant(self) -> Constant:
-        start_token = self.consume(TokenType.CONSTANT)
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.EQUALS)
+        start_token = self.consume_CONSTANT()
+        name = self.consume_IDENTIFIER().value
+        self.consume_EQUALS()
         value = self.parse_expression()
-        return Constant(name=name, value=value,
-                        line=start_token.line, column=start_token.column)
+        return Constant(start_token.line, start_token.column, name, value)
+
+    # Statement-keyword dispatch: same scheme as _DECL_DISPATCH.  Tokens that
+    # need lookahead guards (arrows, FUSEDTYPE, IDENTIFIER) stay out of it.
+    _STMT_DISPATCH = {
+        TokenType.RUNTASK: 'parse_runtask',
+        TokenType.PRINTMESSAGE: 'parse_printmessage',
+        TokenType.RETURNVALUE: 'parse_returnvalue',
+        TokenType.IFCONDITION: 'parse_if',
+        TokenType.CHOOSEPATH: 'parse_choosepath',
+        TokenType.WHILELOOP: 'parse_while',
+        TokenType.FOREVERY: 'parse_forevery',
+        TokenType.TRYBLOCK: 'parse_try',
+        TokenType.SENDMESSAGE: 'parse_sendmessage',
+        TokenType.RECEIVEMESSAGE: 'parse_receivemessage',
+        TokenType.EVERYINTERVAL: 'parse_everyinterval',
+        TokenType.WITHSECURITY: 'parse_withsecurity',
+        TokenType.BREAKLOOP: 'parse_breakloop',
+        TokenType.CONTINUELOOP: 'parse_continueloop',
+        TokenType.HALTPROGRAM: 'parse_haltprogram',
+        # === Low-Level Statements ===
+        TokenType.ENABLEINTERRUPTS: 'parse_interrupt_control',
+        TokenType.DISABLEINTERRUPTS: 'parse_interrupt_control',
+        TokenType.INLINEASSEMBLY: 'parse_inline_assembly',
+        TokenType.SYSTEMCALL: 'parse_system_call',
+        # === Virtual Memory Statements ===
+        TokenType.PAGETABLE: 'parse_vm_operation',
+        TokenType.VIRTUALMEMORY: 'parse_vm_operation',
+        TokenType.CACHE: 'parse_vm_operation',
+        TokenType.TLB: 'parse_vm_operation',
+        TokenType.MEMORYBARRIER: 'parse_vm_operation',
+    }
+
+    def parse_breakloop(self) -> BreakLoop:
+        self.advance()
+        return BreakLoop(self.lines[self.position], self.columns[self.position])
+
+    def parse_continueloop(self) -> ContinueLoop:
+        self.advance()
+        return ContinueLoop(self.lines[self.position], self.columns[self.position])
 
     def parse_statement(self) -> Optional[ASTNode]:
-        self.skip_newlines()
-        if self.match(TokenType.COMMENT, TokenType.DOC_COMMENT, TokenType.COM_COMMENT, TokenType.TAG_COMMENT):
+        # The whole statement head works on type ordinals read once from the
+        # token arrays; no Token object is materialized to pick a branch.
+        t0 = self.types[self.position]
+        if _COMMENT_MASK[t0]:
             self.advance()
             return None
-        if self.peek() and self.peek().type in [TokenType.ARROW_LEFT, TokenType.ARROW_RIGHT, TokenType.ARROW_BIDIRECTIONAL]:
+        if _ARROW_MASK[self.peek_type()]:
             return self.parse_data_flow_assignment()
-        if self.match(TokenType.RUNTASK):
-            return self.parse_runtask()
-        elif self.match(TokenType.PRINTMESSAGE):
-            return self.parse_printmessage()
-        elif self.match(TokenType.RETURNVALUE):
-            return self.parse_returnvalue()
-        elif self.match(TokenType.IFCONDITION):
-            return self.parse_if()
-        elif self.match(TokenType.CHOOSEPATH):
-            return self.parse_choosepath()
-        elif self.match(TokenType.WHILELOOP):
-            return self.parse_while()
-        elif self.match(TokenType.FOREVERY):
-            return self.parse_forevery()
-        elif self.match(TokenType.TRYBLOCK):
-            return self.parse_try()
-        elif self.match(TokenType.SENDMESSAGE):
-            return self.parse_sendmessage()
-        elif self.match(TokenType.RECEIVEMESSAGE):
-            return self.parse_receivemessage()
-        elif self.match(TokenType.EVERYINTERVAL):
-            return self.parse_everyinterval()
-        elif self.match(TokenType.WITHSECURITY):
-            return self.parse_withsecurity()
-        elif self.match(TokenType.BREAKLOOP):
-            self.advance()
-            return BreakLoop(line=self.current_token.line, column=self.current_token.column)
-        elif self.match(TokenType.CONTINUELOOP):
-            self.advance()
-            return ContinueLoop(line=self.current_token.line, column=self.current_token.column)
-        elif self.match(TokenType.HALTPROGRAM):
-            return self.parse_haltprogram()
-        # === NEW: Low-Level Statement Parsing ===
-        elif self.match(TokenType.ENABLEINTERRUPTS):
-            return self.parse_interrupt_control()
-        elif self.match(TokenType.DISABLEINTERRUPTS):
-            return self.parse_interrupt_control()
-        elif self.match(TokenType.INLINEASSEMBLY):
-            return self.parse_inline_assembly()
-        elif self.match(TokenType.SYSTEMCALL):
-            return self.parse_system_call()
-        # === NEW: Virtual Memory Statement Parsing ===
-        elif self.match(TokenType.PAGETABLE, TokenType.VIRTUALMEMORY, TokenType.CACHE, 
-                    TokenType.TLB, TokenType.MEMORYBARRIER):
-            return self.parse_vm_operation()
-        elif self.match(TokenType.FUSEDTYPE):
-            if self.peek() and self.peek().type == TokenType.LPAREN:
+        handler = self._stmt_dispatch.get(t0)
+        if handler is not None:
+            return handler()
+        if t0 == _FUSEDTYPE_VAL:
+            if self.peek_type() == _LPAREN_VAL:
                 return self.parse_fused_function_call()
             else:
                 expr = self.parse_expression()
                 return expr
-        elif self.match(TokenType.IDENTIFIER):
-            if self.peek() and self.peek().type == TokenType.EQUALS:
+        elif t0 == _IDENTIFIER_VAL:
+            if self.peek_type() == _EQUALS_VAL:
                 return self.parse_assignment()
             else:
                 expr = self.parse_expression()
@@ -726,25 +1062,27 @@ class Parser:
     #====== data flow assignment parsing 
     
     def parse_data_flow_assignment(self):
+        arrow_line = self.lines[self.position]
+        arrow_col = self.columns[self.position]
         left_expr = self.parse_expression()  # Parse left operand
         
         if self.current_token.type == TokenType.ARROW_LEFT:
             operator = "left_arrow"
             self.advance()
             right_expr = self.parse_expression()
-            return DataFlowAssignment(operator, left_expr, right_expr)
+            return DataFlowAssignment(arrow_line, arrow_col, operator, left_expr, right_expr)
         
         elif self.current_token.type == TokenType.ARROW_RIGHT:
             operator = "right_arrow" 
             self.advance()
             right_expr = self.parse_expression()
-            return DataFlowAssignment(operator, left_expr, right_expr)
+            return DataFlowAssignment(arrow_line, arrow_col, operator, left_expr, right_expr)
         
         elif self.current_token.type == TokenType.ARROW_BIDIRECTIONAL:
             operator = "bidirectional_arrow"
             self.advance()
             right_expr = self.parse_expression()
-            return DataFlowAssignment(operator, left_expr, right_expr)
+            return DataFlowAssignment(arrow_line, arrow_col, operator, left_expr, right_expr)
     
     
     # === NEW: Low-Level Statement Parsing Methods ===
@@ -755,19 +1093,15 @@ class Parser:
         operation = "enable" if start_token.type == TokenType.ENABLEINTERRUPTS else "disable"
         self.advance()
         
-        return InterruptControl(
-            operation=operation,
-            line=start_token.line,
-            column=start_token.column
-        )
+        return InterruptControl(start_token.line, start_token.column, operation)
 
     def parse_inline_assembly(self) -> InlineAssembly:
         """Parse inline assembly blocks"""
-        start_token = self.consume(TokenType.INLINEASSEMBLY)
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_INLINEASSEMBLY()
+        self.consume_LPAREN()
         
         # Parse assembly code string
-        assembly_code = self.consume(TokenType.STRING).value
+        assembly_code = self.consume_STRING().value
         
         # Optional inputs, outputs, clobbers
         inputs = []
@@ -776,12 +1110,11 @@ class Parser:
         volatile = False
         
         while self.match(TokenType.COMMA):
-            self.consume(TokenType.COMMA)
-            self.skip_newlines()
+            self.consume_COMMA()
             
             if self.match(TokenType.IDENTIFIER):
-                param_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.COLON)
+                param_name = self.consume_IDENTIFIER().value
+                self.consume_COLON()
                 
                 if param_name == "inputs":
                     inputs = self.parse_assembly_constraints()
@@ -790,585 +1123,493 @@ class Parser:
                 elif param_name == "clobbers":
                     clobbers = self.parse_string_array()
                 elif param_name == "volatile":
-                    volatile = self.parse_expression().value if hasattr(self.parse_expression(), 'value') else True
+                    volatile_expr = self.parse_expression()
+                    volatile = volatile_expr.value if hasattr(volatile_expr, 'value') else True
         
-        self.consume(TokenType.RPAREN)
-        return InlineAssembly(
-            assembly_code=assembly_code,
-            inputs=inputs,
-            outputs=outputs,
-            clobbers=clobbers,
-            volatile=volatile,
-            line=start_token.line,
-            column=start_token.column
-        )
+        self.consume_RPAREN()
+        return InlineAssembly(start_token.line, start_token.column, assembly_code, inputs, outputs, clobbers, volatile)
 
     def parse_assembly_constraints(self) -> List[Tuple[str, ASTNode]]:
         """Parse assembly input/output constraints"""
         constraints = []
-        self.consume(TokenType.LBRACKET)
-        
+        constraints_append = constraints.append
+        self.consume_LBRACKET()
+
         while not self.match(TokenType.RBRACKET):
-            constraint = self.consume(TokenType.STRING).value
-            self.consume(TokenType.COLON)
+            constraint = self.consume_STRING().value
+            self.consume_COLON()
             value = self.parse_expression()
-            constraints.append((constraint, value))
+            constraints_append((constraint, value))
             
             if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
+                self.consume_COMMA()
         
-        self.consume(TokenType.RBRACKET)
+        self.consume_RBRACKET()
         return constraints
 
     def parse_system_call(self) -> SystemCall:
         """Parse system call statements"""
-        start_token = self.consume(TokenType.SYSTEMCALL)
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_SYSTEMCALL()
+        self.consume_LPAREN()
         
         call_number = self.parse_expression()
         arguments = []
-        
-        while self.match(TokenType.COMMA):
-            self.consume(TokenType.COMMA)
-            self.skip_newlines()
+        types = self.types
+
+        while types[self.position] == _COMMA_VAL:
+            self.advance()
             arguments.append(self.parse_expression())
-        
-        self.consume(TokenType.RPAREN)
-        return SystemCall(
-            call_number=call_number,
-            arguments=arguments,
-            line=start_token.line,
-            column=start_token.column
-        )
+
+        self.consume_RPAREN()
+        return SystemCall(start_token.line, start_token.column, call_number, arguments)
 
     def parse_runtask(self) -> RunTask:
-        start_token = self.consume(TokenType.RUNTASK)
+        start_token = self.consume_RUNTASK()
         task_name = self.parse_dotted_name()
         arguments = []
         if self.match(TokenType.LPAREN):
-            self.consume(TokenType.LPAREN)
+            self.consume_LPAREN()
             while not self.match(TokenType.RPAREN):
-                param_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.DASH)
+                param_name = self.consume_IDENTIFIER().value
+                self.consume_DASH()
                 param_value = self.parse_expression()
                 arguments.append((param_name, param_value))
                 if self.match(TokenType.COMMA):
-                    self.consume(TokenType.COMMA)
-                    self.skip_newlines()
-            self.consume(TokenType.RPAREN)
-        return RunTask(task_name=task_name, arguments=arguments,
-                       line=start_token.line, column=start_token.column)
+                    self.consume_COMMA()
+            self.consume_RPAREN()
+        return RunTask(start_token.line, start_token.column, task_name, arguments)
 
     def parse_printmessage(self) -> PrintMessage:
-        start_token = self.consume(TokenType.PRINTMESSAGE)
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_PRINTMESSAGE()
+        self.consume_LPAREN()
         message = self.parse_expression()
-        self.consume(TokenType.RPAREN)
-        return PrintMessage(message=message, line=start_token.line, column=start_token.column)
+        self.consume_RPAREN()
+        return PrintMessage(start_token.line, start_token.column, message)
 
     def parse_returnvalue(self) -> ReturnValue:
-        start_token = self.consume(TokenType.RETURNVALUE)
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_RETURNVALUE()
+        self.consume_LPAREN()
         value = self.parse_expression()
-        self.consume(TokenType.RPAREN)
-        return ReturnValue(value=value, line=start_token.line, column=start_token.column)
+        self.consume_RPAREN()
+        return ReturnValue(start_token.line, start_token.column, value)
 
     def parse_if(self) -> If:
-        start_token = self.consume(TokenType.IFCONDITION)
+        start_token = self.consume_IFCONDITION()
         condition = self.parse_expression()
-        self.consume(TokenType.THENBLOCK)
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context("IfCondition.ThenBlock")
-        then_body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                then_body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        self.skip_newlines()
+        self.consume_THENBLOCK()
+        then_body = self._parse_braced_block("IfCondition.ThenBlock")
         else_body = None
         if self.match(TokenType.ELSEBLOCK):
-            self.consume(TokenType.ELSEBLOCK)
-            self.skip_newlines()
-            self.consume(TokenType.LBRACE)
-            self.skip_newlines()
-            self.push_context("IfCondition.ElseBlock")
-            else_body = []
-            while not self.match(TokenType.RBRACE):
-                stmt = self.parse_statement()
-                if stmt:
-                    else_body.append(stmt)
-                self.skip_newlines()
-            self.consume(TokenType.RBRACE)
-            self.pop_context()
-        return If(condition=condition, then_body=then_body, else_body=else_body,
-                  line=start_token.line, column=start_token.column)
+            self.consume_ELSEBLOCK()
+            else_body = self._parse_braced_block("IfCondition.ElseBlock")
+        return If(start_token.line, start_token.column, condition, then_body, else_body)
 
     def parse_choosepath(self) -> ChoosePath:
-        start_token = self.consume(TokenType.CHOOSEPATH)
-        self.consume(TokenType.LPAREN)
+        start_token = self.consume_CHOOSEPATH()
+        self.consume_LPAREN()
         expression = self.parse_expression()
-        self.consume(TokenType.RPAREN)
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        self.consume_RPAREN()
+        self.consume_LBRACE()
         self.push_context("ChoosePath")
         cases = []
+        cases_append = cases.append
         default = None
         while not self.match(TokenType.RBRACE):
             if self.match(TokenType.CASEOPTION):
-                self.consume(TokenType.CASEOPTION)
-                case_value = self.consume(TokenType.STRING).value
-                self.consume(TokenType.COLON)
+                self.consume_CASEOPTION()
+                case_value = self.consume_STRING().value
+                self.consume_COLON()
                 case_body = []
                 stmt = self.parse_statement()
                 if stmt:
                     case_body.append(stmt)
-                cases.append((case_value, case_body))
+                cases_append((case_value, case_body))
             elif self.match(TokenType.DEFAULTOPTION):
-                self.consume(TokenType.DEFAULTOPTION)
-                self.consume(TokenType.COLON)
+                self.consume_DEFAULTOPTION()
+                self.consume_COLON()
                 default = []
                 stmt = self.parse_statement()
                 if stmt:
                     default.append(stmt)
             else:
                 self.advance()
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
+        self.consume_RBRACE()
         self.pop_context()
-        return ChoosePath(expression=expression, cases=cases, default=default,
-                         line=start_token.line, column=start_token.column)
+        return ChoosePath(start_token.line, start_token.column, expression, cases, default)
 
     def parse_while(self) -> While:
-        start_token = self.consume(TokenType.WHILELOOP)
+        start_token = self.consume_WHILELOOP()
         condition = self.parse_expression()
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context("WhileLoop")
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return While(condition=condition, body=body,
-                     line=start_token.line, column=start_token.column)
+        body = self._parse_braced_block("WhileLoop")
+        return While(start_token.line, start_token.column, condition, body)
 
     def parse_forevery(self) -> ForEvery:
-        start_token = self.consume(TokenType.FOREVERY)
-        variable = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.IN)
+        start_token = self.consume_FOREVERY()
+        variable = self.consume_IDENTIFIER().value
+        self.consume_IN()
         collection = self.parse_expression()
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context(f"ForEvery({variable})")
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return ForEvery(variable=variable, collection=collection, body=body,
-                        line=start_token.line, column=start_token.column)
+        body = self._parse_braced_block(f"ForEvery({variable})")
+        return ForEvery(start_token.line, start_token.column, variable, collection, body)
 
     def parse_try(self) -> Try:
-        start_token = self.consume(TokenType.TRYBLOCK)
-        self.consume(TokenType.COLON)
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context("TryBlock")
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        self.skip_newlines()
+        start_token = self.consume_TRYBLOCK()
+        self.consume_COLON()
+        body = self._parse_braced_block("TryBlock")
         catch_clauses = []
         while self.match(TokenType.CATCHERROR):
-            self.consume(TokenType.CATCHERROR)
-            error_type = self.consume(TokenType.IDENTIFIER).value
-            self.skip_newlines()
-            self.consume(TokenType.LBRACE)
-            self.skip_newlines()
-            self.push_context(f"CatchError.{error_type}")
-            catch_body = []
-            while not self.match(TokenType.RBRACE):
-                stmt = self.parse_statement()
-                if stmt:
-                    catch_body.append(stmt)
-                self.skip_newlines()
-            self.consume(TokenType.RBRACE)
-            self.pop_context()
-            self.skip_newlines()
+            self.consume_CATCHERROR()
+            error_type = self.consume_IDENTIFIER().value
+            catch_body = self._parse_braced_block(f"CatchError.{error_type}")
             catch_clauses.append((error_type, catch_body))
         finally_body = None
         if self.match(TokenType.FINALLYBLOCK):
-            self.consume(TokenType.FINALLYBLOCK)
-            self.consume(TokenType.COLON)
-            self.skip_newlines()
-            self.consume(TokenType.LBRACE)
-            self.skip_newlines()
-            self.push_context("FinallyBlock")
-            finally_body = []
-            while not self.match(TokenType.RBRACE):
-                stmt = self.parse_statement()
-                if stmt:
-                    finally_body.append(stmt)
-                self.skip_newlines()
-            self.consume(TokenType.RBRACE)
-            self.pop_context()
-        return Try(body=body, catch_clauses=catch_clauses, finally_body=finally_body,
-                  line=start_token.line, column=start_token.column)
+            self.consume_FINALLYBLOCK()
+            self.consume_COLON()
+            finally_body = self._parse_braced_block("FinallyBlock")
+        return Try(start_token.line, start_token.column, body, catch_clauses, finally_body)
 
     def parse_sendmessage(self) -> SendMessage:
-        start_token = self.consume(TokenType.SENDMESSAGE)
-        target = self.consume(TokenType.IDENTIFIER).value
+        start_token = self.consume_SENDMESSAGE()
+        target = self.consume_IDENTIFIER().value
         parameters = {}
         if self.match(TokenType.LPAREN):
-            self.consume(TokenType.LPAREN)
-            self.skip_newlines()
+            self.consume_LPAREN()
             while not self.match(TokenType.RPAREN):
-                self.skip_newlines()
                 if self.match(TokenType.RPAREN):
                     break
-                param_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.DASH)
+                param_name = self.consume_IDENTIFIER().value
+                self.consume_DASH()
                 param_value = self.parse_expression()
                 parameters[param_name] = param_value
                 if self.match(TokenType.COMMA):
-                    self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            self.consume(TokenType.RPAREN)
-        return SendMessage(target=target, parameters=parameters,
-                         line=start_token.line, column=start_token.column)
+                    self.consume_COMMA()
+            self.consume_RPAREN()
+        return SendMessage(start_token.line, start_token.column, target, parameters)
 
     def parse_receivemessage(self) -> ReceiveMessage:
-        start_token = self.consume(TokenType.RECEIVEMESSAGE)
-        message_type = self.consume(TokenType.IDENTIFIER).value
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context(f"ReceiveMessage.{message_type}")
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return ReceiveMessage(message_type=message_type, body=body,
-                            line=start_token.line, column=start_token.column)
+        start_token = self.consume_RECEIVEMESSAGE()
+        message_type = self.consume_IDENTIFIER().value
+        body = self._parse_braced_block(f"ReceiveMessage.{message_type}")
+        return ReceiveMessage(start_token.line, start_token.column, message_type, body)
 
     def parse_everyinterval(self) -> EveryInterval:
-        start_token = self.consume(TokenType.EVERYINTERVAL)
-        interval_type = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.DASH)
-        interval_value = self.consume(TokenType.NUMBER).value
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context(f"EveryInterval({interval_type}-{interval_value})")
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return EveryInterval(interval_type=interval_type, interval_value=interval_value,
-                           body=body, line=start_token.line, column=start_token.column)
+        start_token = self.consume_EVERYINTERVAL()
+        interval_type = self.consume_IDENTIFIER().value
+        self.consume_DASH()
+        interval_value = self.consume_NUMBER().value
+        body = self._parse_braced_block(f"EveryInterval({interval_type}-{interval_value})")
+        return EveryInterval(start_token.line, start_token.column, interval_type, interval_value, body)
 
     def parse_withsecurity(self) -> WithSecurity:
-        start_token = self.consume(TokenType.WITHSECURITY)
-        self.consume(TokenType.LPAREN)
-        self.consume(TokenType.IDENTIFIER)
-        self.consume(TokenType.DASH)
-        context = self.consume(TokenType.STRING).value
-        self.consume(TokenType.RPAREN)
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        self.push_context(f"WithSecurity({context})")
-        body = []
-        while not self.match(TokenType.RBRACE):
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-            self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        self.pop_context()
-        return WithSecurity(context=context, body=body,
-                          line=start_token.line, column=start_token.column)
+        start_token = self.consume_WITHSECURITY()
+        self.consume_LPAREN()
+        self.consume_IDENTIFIER()
+        self.consume_DASH()
+        context = self.consume_STRING().value
+        self.consume_RPAREN()
+        body = self._parse_braced_block(f"WithSecurity({context})")
+        return WithSecurity(start_token.line, start_token.column, context, body)
 
     def parse_haltprogram(self) -> HaltProgram:
-        start_token = self.consume(TokenType.HALTPROGRAM)
+        start_token = self.consume_HALTPROGRAM()
         message = None
         if self.match(TokenType.LPAREN):
-            self.consume(TokenType.LPAREN)
+            self.consume_LPAREN()
             if self.match(TokenType.STRING):
-                message = self.consume(TokenType.STRING).value
-            self.consume(TokenType.RPAREN)
-        return HaltProgram(message=message, line=start_token.line, column=start_token.column)
+                message = self.consume_STRING().value
+            self.consume_RPAREN()
+        return HaltProgram(start_token.line, start_token.column, message)
 
     def parse_assignment(self) -> Assignment:
-        target = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.EQUALS)
+        target = self.consume_IDENTIFIER().value
+        self.consume_EQUALS()
         value = self.parse_expression()
-        return Assignment(target=target, value=value,
-                          line=self.current_token.line, column=self.current_token.column)
+        return Assignment(self.lines[self.position], self.columns[self.position], target, value)
 
+    @memoize_rule(_RULE_EXPRESSION)
     def parse_expression(self) -> ASTNode:
         """Parse expression with support for top-level binary operators"""
-        self.skip_newlines()
         
         # Parse the left side first
         left = self.parse_strict_expression()
-        self.skip_newlines()
-        
-        # Check for binary operators at the top level
-        while self.current_token and self.current_token.type in self.BINARY_OPERATORS:
+
+        # Check for binary operators at the top level; hot lookups run on
+        # locals over the type array.
+        types = self.types
+        binop_mask = _BINOP_MASK
+        advance = self.advance
+        pstrict = self.parse_strict_expression
+        while binop_mask[types[self.position]]:
             op_token = self.current_token
             op = op_token.value
-            self.advance()
-            self.skip_newlines()
-            
+            advance()
+
             # Parse the right side
-            right = self.parse_strict_expression()
-            
+            right = pstrict()
+
             # Create binary expression
-            left = BinaryExpression(
-                left=left,
-                operator=op,
-                right=right,
-                line=op_token.line,
-                column=op_token.column
-            )
-            self.skip_newlines()
-        
+            left = BinaryExpression(op_token.line, op_token.column, left, op, right)
+
         return left
 
+    # Expression entry dispatch: FIRST(1) table keyed by type ordinal, with a
+    # FIRST(2) overlay for the one two-token decision (FusedType call vs bare
+    # fused type). Names resolve to direct callables at module bottom.
+    _EXPR_FIRST1 = {
+        TokenType.LPAREN: 'parse_parenthesized_expression',
+        **{tt: 'parse_math_function' for tt in (
+            TokenType.ADD, TokenType.MULTIPLY, TokenType.DIVIDE,
+            TokenType.SUBTRACT, TokenType.POWER, TokenType.SQUAREROOT,
+            TokenType.GREATERTHAN, TokenType.LESSTHAN, TokenType.EQUALTO,
+            TokenType.NOTEQUAL, TokenType.GREATEREQUAL, TokenType.LESSEQUAL,
+            TokenType.AND, TokenType.OR, TokenType.NOT,
+            TokenType.READINPUT, TokenType.READINPUTNUMBER,
+            TokenType.GETUSERCHOICE, TokenType.STRINGEQUALS,
+            TokenType.STRINGCONTAINS, TokenType.STRINGCONCAT,
+            TokenType.STRINGLENGTH, TokenType.STRINGTONUMBER,
+            TokenType.NUMBERTOSTRING, TokenType.WRITETEXTFILE,
+            TokenType.READTEXTFILE, TokenType.FILEEXISTS)},
+        **{tt: 'parse_lowlevel_function' for tt in (
+            TokenType.DEREFERENCE, TokenType.ADDRESSOF, TokenType.SIZEOF,
+            TokenType.ALLOCATE, TokenType.DEALLOCATE, TokenType.MEMORYCOPY,
+            TokenType.PORTREAD, TokenType.PORTWRITE,
+            TokenType.HARDWAREREGISTER, TokenType.ATOMICREAD,
+            TokenType.ATOMICWRITE, TokenType.MMIOREAD, TokenType.MMIOWRITE)},
+        **{tt: 'parse_vm_operation' for tt in (
+            TokenType.PAGETABLE, TokenType.VIRTUALMEMORY, TokenType.CACHE,
+            TokenType.TLB, TokenType.MEMORYBARRIER)},
+        TokenType.FUSEDTYPE: 'parse_fused_type',
+    }
+    _EXPR_FIRST2 = {
+        (TokenType.FUSEDTYPE, TokenType.LPAREN): 'parse_fused_function_call',
+    }
+
+    @memoize_rule(_RULE_STRICT_EXPRESSION)
     def parse_strict_expression(self) -> ASTNode:
-        self.skip_newlines()
-        if self.match(TokenType.LPAREN):
-            return self.parse_parenthesized_expression()
-        if self.match(TokenType.ADD, TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.SUBTRACT, 
-                  TokenType.POWER, TokenType.SQUAREROOT, TokenType.GREATERTHAN, TokenType.LESSTHAN,
-                  TokenType.EQUALTO, TokenType.NOTEQUAL, TokenType.GREATEREQUAL, TokenType.LESSEQUAL,
-                  TokenType.AND, TokenType.OR, TokenType.NOT, TokenType.SQUAREROOT,
-                  TokenType.READINPUT, TokenType.READINPUTNUMBER, TokenType.GETUSERCHOICE,
-                  TokenType.STRINGEQUALS, TokenType.STRINGCONTAINS, TokenType.STRINGCONCAT,
-                  TokenType.STRINGLENGTH, TokenType.STRINGTONUMBER, TokenType.NUMBERTOSTRING,
-                  TokenType.WRITETEXTFILE, TokenType.READTEXTFILE, TokenType.FILEEXISTS):
-            return self.parse_math_function()
-        # === NEW: Low-Level Function Parsing ===
-        elif self.match(TokenType.DEREFERENCE, TokenType.ADDRESSOF, TokenType.SIZEOF,
-                    TokenType.ALLOCATE, TokenType.DEALLOCATE, TokenType.MEMORYCOPY,
-                    TokenType.PORTREAD, TokenType.PORTWRITE, TokenType.HARDWAREREGISTER,
-                    TokenType.ATOMICREAD, TokenType.ATOMICWRITE, TokenType.MMIOREAD, TokenType.MMIOWRITE):
-            return self.parse_lowlevel_function()
-    # === NEW: Virtual Memory Expression Parsing ===
-        elif self.match(TokenType.PAGETABLE, TokenType.VIRTUALMEMORY, TokenType.CACHE, 
-                    TokenType.TLB, TokenType.MEMORYBARRIER):
-            return self.parse_vm_operation()
-        elif self.match(TokenType.FUSEDTYPE):
-            if self.peek() and self.peek().type == TokenType.LPAREN:
-                return self.parse_fused_function_call()
-            else:
-                return self.parse_fused_type()
+        types = self.types
+        pos = self.position
+        t0 = types[pos]
+        handler = None
+        if pos + 1 < self._n:
+            handler = _EXPR_FIRST2.get((t0, types[pos + 1]))
+        if handler is None:
+            handler = _EXPR_FIRST1.get(t0)
+        if handler is not None:
+            return handler(self)
         return self.parse_primary()
 
+    @memoize_rule(_RULE_PARENTHESIZED)
     def parse_parenthesized_expression(self) -> ASTNode:
-        start_token = self.consume(TokenType.LPAREN)
-        self.skip_newlines()
+        start_token = self.consume_LPAREN()
         
         # NEW: Enhanced infix detection that handles nested parentheses
         saved_position = self.position
-        saved_token = self.current_token
-        
+
         # Check if this looks like infix expression
         is_infix = False
         
         # If we see another LPAREN, peek inside to check for infix pattern
         if self.match(TokenType.LPAREN):
-            # Save position and look ahead
+            # Scan only the top level of this paren group: nested groups are
+            # hopped over via the matching-paren table instead of re-walking
+            # them with a depth counter.
+            types = self.types
+            n = self._n
+            pm = self.paren_match
+            close = pm[self.position]
+            end = close if close >= 0 else n
+            binop_mask = _BINOP_MASK
+            value_start_mask = _INFIX_START_MASK
+            lparen = TokenType.LPAREN.value
             inner_pos = self.position + 1
-            depth = 1
-            
-            # Skip through nested parens to find first real token
-            while inner_pos < len(self.tokens) and depth > 0:
-                tok = self.tokens[inner_pos]
-                if tok.type == TokenType.LPAREN:
-                    depth += 1
-                elif tok.type == TokenType.RPAREN:
-                    depth -= 1
-                elif depth == 1 and tok.type in (TokenType.NUMBER, TokenType.IDENTIFIER, TokenType.SUBTRACT):
+            while inner_pos < end:
+                tt = types[inner_pos]
+                if tt == lparen:
+                    nested_close = pm[inner_pos]
+                    inner_pos = nested_close + 1 if nested_close >= 0 else end
+                    continue
+                if value_start_mask[tt]:
                     # Found a value token, check if followed by operator
                     next_pos = inner_pos + 1
-                    if next_pos < len(self.tokens) and self.tokens[next_pos].type in self.BINARY_OPERATORS:
+                    if next_pos < n and binop_mask[types[next_pos]]:
                         is_infix = True
                         break
                 inner_pos += 1
-        
+
         # Also check for direct infix pattern (a + b)
-        elif self.match(TokenType.NUMBER, TokenType.IDENTIFIER, TokenType.SUBTRACT):
+        elif _INFIX_START_MASK[self.types[self.position]]:
             lookahead_pos = 1
             if self.match(TokenType.SUBTRACT):
                 lookahead_pos = 2
-            
-            future_token = self.peek(lookahead_pos)
-            if future_token and future_token.type in self.BINARY_OPERATORS:
+
+            if _BINOP_MASK[self.peek_type(lookahead_pos)]:
                 is_infix = True
         
         # Parse based on detected pattern
         if is_infix:
             # Parse as new infix expression
             expr = self.parse_infix_expression()
-            self.skip_newlines()
-            self.consume(TokenType.RPAREN)
-            return ParenthesizedExpression(expression=expr,
-                                        line=start_token.line, 
-                                        column=start_token.column)
+            self.consume_RPAREN()
+            return ParenthesizedExpression(start_token.line, start_token.column, expr)
         else:
             # Reset position and parse normally
             self.position = saved_position
-            self.current_token = saved_token
-            
+
             # Parse the inner expression recursively (YOUR EXISTING CODE)
             expr = self.parse_expression()
-            self.skip_newlines()
             
             # Check for infix notation (e.g., "(2 Multiply 3)") - YOUR EXISTING CODE
             if isinstance(expr, (Number, Identifier, FunctionCall)):
-                self.skip_newlines()
-                if self.match(TokenType.ADD, TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.SUBTRACT,
-                            TokenType.POWER, TokenType.GREATERTHAN, TokenType.LESSTHAN,
-                            TokenType.EQUALTO, TokenType.NOTEQUAL, TokenType.GREATEREQUAL,
-                            TokenType.LESSEQUAL, TokenType.AND, TokenType.OR):
+                if _PAREN_INFIX_OP_MASK[self.types[self.position]]:
                     op_token = self.current_token
                     op_name = op_token.value
                     self.advance()
-                    self.skip_newlines()
                     second_operand = self.parse_expression()
-                    self.skip_newlines()
-                    self.consume(TokenType.RPAREN)
-                    return FunctionCall(function=op_name, arguments=[expr, second_operand],
-                                    line=start_token.line, column=start_token.column)
+                    self.consume_RPAREN()
+                    return _FunctionCall(start_token.line, start_token.column, op_name, [expr, second_operand])
                 
-                self.skip_newlines()
-            self.consume(TokenType.RPAREN)
+            self.consume_RPAREN()
             return expr
         
     def parse_infix_expression(self) -> ASTNode:
         """Parse infix expression - handles precedence and associativity"""
         return self.parse_infix_binary(0)
 
+    @memoize_rule_arg(_RULE_INFIX_BINARY)
     def parse_infix_binary(self, min_precedence: int) -> ASTNode:
-        """Parse binary expressions with precedence climbing"""
-        # Parse left side (could be unary, grouped, or primary)
-        left = self.parse_infix_unary()
-        
-        # Parse binary operators with precedence
-        while (self.current_token and 
-            self.current_token.type in self.BINARY_OPERATORS and
-            self.get_precedence(self.current_token.type) >= min_precedence):
-            
-            op_token = self.current_token
-            op = op_token.value
-            precedence = self.get_precedence(op_token.type)
+        """Parse binary expressions with an iterative shunting-yard loop.
+
+        Explicit operand/operator stacks instead of precedence-climbing
+        recursion: no Python frame per operator, and a long flat chain
+        like a+b+c+... cannot hit the recursion limit. All operators are
+        left associative, so a stacked operator reduces while its
+        precedence is >= the incoming one.
+        """
+        out = [self.parse_infix_unary()]
+        ops = []  # (op value, precedence, line, column)
+
+        types = self.types
+        values = self.values
+        lines = self.lines
+        columns = self.columns
+        binop_prec = _BINOP_PREC
+        while True:
+            pos = self.position
+            precedence = binop_prec[types[pos]]
+            if precedence < min_precedence:
+                break
+            while ops and ops[-1][1] >= precedence:
+                right = out.pop()
+                left = out.pop()
+                op, _, op_line, op_col = ops.pop()
+                out.append(BinaryExpression(op_line, op_col, left, op, right))
+            ops.append((values[pos], precedence, lines[pos], columns[pos]))
             self.advance()
-            self.skip_newlines()
-            
-            # Right associative operators use same precedence, left associative use precedence + 1
-            next_min_prec = precedence + 1  # Assuming left associative for now
-            
-            right = self.parse_infix_binary(next_min_prec)
-            left = BinaryExpression(left=left, operator=op, right=right,
-                                line=op_token.line, column=op_token.column)
-            self.skip_newlines()
-        
-        return left
+            out.append(self.parse_infix_unary())
+
+        while ops:
+            right = out.pop()
+            left = out.pop()
+            op, _, op_line, op_col = ops.pop()
+            out.append(BinaryExpression(op_line, op_col, left, op, right))
+        return out[0]
 
     def parse_infix_unary(self) -> ASTNode:
         """Parse unary expressions and grouped expressions"""
-        self.skip_newlines()
-        
+        pos = self.position
+        t0 = self.types[pos]
+
         # Handle unary operators
-        if self.current_token and self.current_token.type in self.UNARY_OPERATORS:
-            op_token = self.current_token
-            op = op_token.value
+        if _UNARY_MASK[t0]:
+            op = self.values[pos]
             self.advance()
             operand = self.parse_infix_unary()
-            return UnaryExpression(operator=op, operand=operand,
-                                line=op_token.line, column=op_token.column)
-        
+            return UnaryExpression(self.lines[pos], self.columns[pos], op, operand)
+
         # Handle grouped expressions
-        elif self.match(TokenType.LPAREN):
+        elif t0 == _LPAREN_VAL:
             self.advance()
-            self.skip_newlines()
             expr = self.parse_infix_binary(0)  # Reset precedence inside parens
-            self.skip_newlines()
-            self.consume(TokenType.RPAREN)
+            self.consume_RPAREN()
             return expr
-        
+
         # Handle primary expressions
         else:
             return self.parse_primary()
 
     def get_precedence(self, token_type: TokenType) -> int:
         """Get operator precedence for precedence climbing"""
-        precedence_map = {
-            TokenType.OR: 1,
-            TokenType.AND: 2,
-            TokenType.EQUALTO: 3,
-            TokenType.NOTEQUAL: 3,
-            TokenType.LESSTHAN: 4,
-            TokenType.GREATERTHAN: 4,
-            TokenType.LESSEQUAL: 4,
-            TokenType.GREATEREQUAL: 4,
-            TokenType.ADD: 5,
-            TokenType.SUBTRACT: 5,
-            TokenType.MULTIPLY: 6,
-            TokenType.DIVIDE: 6,
-            TokenType.POWER: 7
-        }
-        return precedence_map.get(token_type, 0) 
+        return _PRECEDENCE[token_type.value]
     
 
+    def _parse_paren_arglist(self) -> List[ASTNode]:
+        """Parse '( expression (, expression)* )' into an argument list.
+
+        The one shared argument loop behind math, low-level, fused and macro
+        calls; a single hot function instead of four copies of it. The list
+        is pre-sized from the matching-paren span, like _parse_braced_block
+        pre-sizes block bodies, so long argument lists never pay append's
+        reallocation amortization.
+        """
+        # At most one argument per two tokens of span (value, separator).
+        open_pos = self.position
+        close = self.paren_match[open_pos]
+        estimate = (close - open_pos) // 2 if close > open_pos else 0
+        self.consume_LPAREN()
+        args: List[ASTNode] = [None] * estimate
+        count = 0
+        args_append = args.append
+        types = self.types
+        pexpr = self.parse_expression
+        while types[self.position] != _RPAREN_VAL:
+            arg = pexpr()
+            if count < estimate:
+                args[count] = arg
+            else:
+                args_append(arg)
+            count += 1
+            if types[self.position] == _COMMA_VAL:
+                self.advance()
+        del args[count:]
+        self.consume_RPAREN()
+        return args
+
     def parse_math_function(self) -> ASTNode:
         op_token = self.current_token
         op_name = op_token.value
         self.advance()
-        self.consume(TokenType.LPAREN)
-        self.skip_newlines()
-        args = []
-        while not self.match(TokenType.RPAREN):
-            args.append(self.parse_expression())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            elif not self.match(TokenType.RPAREN):
-                self.skip_newlines()
-        self.consume(TokenType.RPAREN)
-        return FunctionCall(function=op_name, arguments=args,
-                           line=op_token.line, column=op_token.column)
+        args = self._parse_paren_arglist()
+        if self.fold_constants:
+            folded = self._try_fold(op_name, args, op_token.line, op_token.column)
+            if folded is not None:
+                return folded
+        return _FunctionCall(op_token.line, op_token.column, op_name, args)
+
+    def _try_fold(self, op_name: str, args: List[ASTNode],
+                  line: int, column: int) -> Optional[ASTNode]:
+        """Fold a named math/boolean call into a literal where it is exact.
+
+        All-literal operands are computed outright and the algebraic
+        identities in _FOLD_IDENTITY (x+0, x*1, x*0, x-x, x**1) collapse
+        to an existing operand; anything inexact - division by zero,
+        oversized powers - is left in the tree for runtime to report.
+        """
+        arith = _FOLD_ARITH.get(op_name)
+        if arith is not None and len(args) == 2:
+            a, b = args
+            if _fold_num(a) and _fold_num(b):
+                if op_name == 'Power' and abs(b.value) > 64:
+                    return None
+                try:
+                    return _Number(line, column, arith(a.value, b.value))
+                except ArithmeticError:
+                    return None
+            rule = _FOLD_IDENTITY.get(op_name)
+            return rule(a, b) if rule is not None else None
+        boolop = _FOLD_BOOL.get(op_name)
+        if boolop is not None and args and all(type(x) is Boolean for x in args):
+            return _Boolean(line, column, boolop([x.value for x in args]))
+        return None
 
     # === NEW: Low-Level Function Parsing ===
 
@@ -1377,177 +1618,133 @@ class Parser:
         op_token = self.current_token
         op_name = op_token.value
         self.advance()
-        self.consume(TokenType.LPAREN)
-        self.skip_newlines()
-        
-        args = []
-        while not self.match(TokenType.RPAREN):
-            args.append(self.parse_expression())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            elif not self.match(TokenType.RPAREN):
-                self.skip_newlines()
-        
-        self.consume(TokenType.RPAREN)
-        
+        args = self._parse_paren_arglist()
+
         # Create specialized AST nodes for certain operations
         if op_name == "Dereference":
-            return Dereference(
-                pointer=args[0] if args else None,
-                size_hint=args[1].value if len(args) > 1 and hasattr(args[1], 'value') else None,
-                line=op_token.line,
-                column=op_token.column
-            )
+            return Dereference(op_token.line, op_token.column, args[0] if args else None, args[1].value if len(args) > 1 and hasattr(args[1], 'value') else None)
         elif op_name == "AddressOf":
-            return AddressOf(
-                variable=args[0] if args else None,
-                line=op_token.line,
-                column=op_token.column
-            )
+            return AddressOf(op_token.line, op_token.column, args[0] if args else None)
         elif op_name == "SizeOf":
-            return SizeOf(
-                target=args[0] if args else None,
-                line=op_token.line,
-                column=op_token.column
-            )
+            return SizeOf(op_token.line, op_token.column, args[0] if args else None)
         elif op_name in ["PortRead", "PortWrite"]:
-            return PortOperation(
-                operation="read" if op_name == "PortRead" else "write",
-                port=args[0] if args else None,
-                size=args[1].value if len(args) > 1 and hasattr(args[1], 'value') else "byte",
-                value=args[2] if len(args) > 2 else None,
-                line=op_token.line,
-                column=op_token.column
-            )
+            return PortOperation(op_token.line, op_token.column, 'read' if op_name == 'PortRead' else 'write', args[0] if args else None, args[1].value if len(args) > 1 and hasattr(args[1], 'value') else 'byte', args[2] if len(args) > 2 else None)
         else:
             # Generic function call for other low-level operations
-            return FunctionCall(function=op_name, arguments=args,
-                               line=op_token.line, column=op_token.column)
+            return _FunctionCall(op_token.line, op_token.column, op_name, args)
 
-    def parse_primary(self) -> ASTNode:
-        self.skip_newlines()
-        
-        # Handle unary minus for negative numbers
-        if self.match(TokenType.SUBTRACT, TokenType.DASH):
-            op_token = self.current_token
-            self.advance()
-            
-            # Check if next token is a number
-            if self.match(TokenType.NUMBER):
-                num_token = self.current_token
-                self.advance()
-                # Create a negative number directly
-                value = -num_token.value if isinstance(num_token.value, (int, float)) else num_token.value
-                return Number(value=value, line=op_token.line, column=op_token.column)
-            else:
-                # It's a unary minus on an expression
-                operand = self.parse_primary()
-                return UnaryExpression(operator='-', operand=operand,
-                                    line=op_token.line, column=op_token.column)
-        # ADD THIS: Handle math functions in primary expressions
-        elif self.match(TokenType.SQUAREROOT, TokenType.ABSOLUTEVALUE, TokenType.ADD, TokenType.SUBTRACT,
-                    TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.POWER, TokenType.MODULO):
-            return self.parse_math_function()        
-        #function for function fusion addition
-        elif self.match(TokenType.FUSEDTYPE):
-            return self.parse_fused_type()
+    def _primary_negative(self) -> ASTNode:
+        # Unary minus: fold directly into a literal when a number follows.
+        op_token = self.current_token
+        self.advance()
         if self.match(TokenType.NUMBER):
-            token = self.current_token
-            self.advance()
-            return Number(value=token.value, line=token.line, column=token.column)
-        elif self.match(TokenType.STRING):
-            token = self.current_token
-            self.advance()
-            return String(value=token.value, line=token.line, column=token.column)
-        elif self.match(TokenType.TRUE):
-            token = self.current_token
+            num_token = self.current_token
             self.advance()
-            return Boolean(value=True, line=token.line, column=token.column)
-        elif self.match(TokenType.FALSE):
-            token = self.current_token
-            self.advance()
-            return Boolean(value=False, line=token.line, column=token.column)
-        elif self.match(TokenType.NULL):
-            token = self.current_token
-            self.advance()
-            return Identifier(name='Null', line=token.line, column=token.column)
-        elif self.match(TokenType.LAMBDA):
-            return self.parse_lambda()
-        elif self.match(TokenType.APPLY):
-            return self.parse_apply()
-        elif self.match(TokenType.RUNTASK):
-            return self.parse_runtask()
-        elif self.match(TokenType.RUNMACRO):
-            return self.parse_runmacro()
-        elif self.match(TokenType.IDENTIFIER):
-            return self.parse_identifier()
-        elif self.match(TokenType.LPAREN):
-            return self.parse_parenthesized_expression()
-        elif self.match(TokenType.LBRACKET):
-            return self.parse_array_literal()
-        elif self.match(TokenType.LBRACE):
-            return self.parse_map_literal()
-        elif self.match(TokenType.PI):
-            token = self.current_token
-            self.advance()
-            return Number(value=3.14159265358979323846, line=token.line, column=token.column)
-        elif self.match(TokenType.E):
-            token = self.current_token
-            self.advance()
-            return Number(value=2.71828182845904523536, line=token.line, column=token.column)
-        elif self.match(TokenType.PHI):
-            token = self.current_token
-            self.advance()
-            return Number(value=1.61803398874989484820, line=token.line, column=token.column)
-        elif self.match(TokenType.BYTES, TokenType.KILOBYTES, TokenType.MEGABYTES,
-                    TokenType.GIGABYTES, TokenType.SECONDS, TokenType.MILLISECONDS,
-                    TokenType.MICROSECONDS, TokenType.PERCENT):
-            return self.parse_unit()
-        elif self.match(TokenType.BYTE, TokenType.WORD, TokenType.DWORD, TokenType.QWORD,
-                    TokenType.UINT8, TokenType.UINT16, TokenType.UINT32, TokenType.UINT64,
-                    TokenType.INT8, TokenType.INT16, TokenType.INT32, TokenType.INT64):
-            return self.parse_lowlevel_type()
-        else:
-            self.error(f"Unexpected token in expression: {self.current_token.value if self.current_token else 'EOF'}")
+            value = -num_token.value if isinstance(num_token.value, (int, float)) else num_token.value
+            return _Number(op_token.line, op_token.column, value)
+        operand = self.parse_primary()
+        return UnaryExpression(op_token.line, op_token.column, '-', operand)
+
+    def _primary_number(self) -> Number:
+        pos = self.position
+        self.advance()
+        return _Number(self.lines[pos], self.columns[pos], self.values[pos])
+
+    def _primary_string(self) -> String:
+        pos = self.position
+        self.advance()
+        return _String(self.lines[pos], self.columns[pos], self.values[pos])
+
+    def _primary_true(self) -> Boolean:
+        pos = self.position
+        self.advance()
+        return _Boolean(self.lines[pos], self.columns[pos], True)
+
+    def _primary_false(self) -> Boolean:
+        pos = self.position
+        self.advance()
+        return _Boolean(self.lines[pos], self.columns[pos], False)
+
+    def _primary_null(self) -> Identifier:
+        pos = self.position
+        self.advance()
+        return _Identifier(self.lines[pos], self.columns[pos], 'Null')
+
+    def _const_number(self, value: float) -> Number:
+        pos = self.position
+        self.advance()
+        return _Number(self.lines[pos], self.columns[pos], value)
+
+    def _primary_pi(self) -> Number:
+        return self._const_number(_PI_VALUE)
+
+    def _primary_e(self) -> Number:
+        return self._const_number(_E_VALUE)
+
+    def _primary_phi(self) -> Number:
+        return self._const_number(_PHI_VALUE)
+
+    # Primary-expression dispatch, keyed by type ordinal at module bottom;
+    # one dict probe replaces the old ~20-branch elif chain of match calls.
+    # SUBTRACT maps to the unary-minus handler, as the elif order used to.
+    _PRIMARY_DISPATCH = {
+        TokenType.SUBTRACT: '_primary_negative',
+        TokenType.DASH: '_primary_negative',
+        **{tt: 'parse_math_function' for tt in (
+            TokenType.SQUAREROOT, TokenType.ABSOLUTEVALUE, TokenType.ADD,
+            TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.POWER,
+            TokenType.MODULO)},
+        TokenType.FUSEDTYPE: 'parse_fused_type',
+        TokenType.NUMBER: '_primary_number',
+        TokenType.STRING: '_primary_string',
+        TokenType.TRUE: '_primary_true',
+        TokenType.FALSE: '_primary_false',
+        TokenType.NULL: '_primary_null',
+        TokenType.LAMBDA: 'parse_lambda',
+        TokenType.APPLY: 'parse_apply',
+        TokenType.RUNTASK: 'parse_runtask',
+        TokenType.RUNMACRO: 'parse_runmacro',
+        TokenType.IDENTIFIER: 'parse_identifier',
+        TokenType.LPAREN: 'parse_parenthesized_expression',
+        TokenType.LBRACKET: 'parse_array_literal',
+        TokenType.LBRACE: 'parse_map_literal',
+        TokenType.PI: '_primary_pi',
+        TokenType.E: '_primary_e',
+        TokenType.PHI: '_primary_phi',
+        **{tt: 'parse_unit' for tt in (
+            TokenType.BYTES, TokenType.KILOBYTES, TokenType.MEGABYTES,
+            TokenType.GIGABYTES, TokenType.SECONDS, TokenType.MILLISECONDS,
+            TokenType.MICROSECONDS, TokenType.PERCENT)},
+        **{tt: 'parse_lowlevel_type' for tt in (
+            TokenType.BYTE, TokenType.WORD, TokenType.DWORD, TokenType.QWORD,
+            TokenType.UINT8, TokenType.UINT16, TokenType.UINT32,
+            TokenType.UINT64, TokenType.INT8, TokenType.INT16,
+            TokenType.INT32, TokenType.INT64)},
+    }
+
+    @memoize_rule(_RULE_PRIMARY)
+    def parse_primary(self) -> ASTNode:
+        handler = _PRIMARY_DISPATCH.get(self.types[self.position])
+        if handler is not None:
+            return handler(self)
+        self.error("Unexpected token in expression: %s",
+                   self.current_token.value if self.current_token else _EOF_NAME)
 
     
     def parse_fused_type(self) -> 'FusedType':
         """Parse a fused type identifier and create a FusedType AST node"""
-        token = self.consume(TokenType.FUSEDTYPE)
+        token = self.consume_FUSEDTYPE()
         fused_value = token.value
         
-        return FusedType(
-            name=fused_value,
-            line=token.line,
-            column=token.column
-        )
+        return FusedType(token.line, token.column, fused_value)
         
         
     def parse_fused_function_call(self) -> FunctionCall:
         """Parse function calls using fused types like VectorDotFloat32+SIMD(a, b)"""
-        fused_token = self.consume(TokenType.FUSEDTYPE)
+        fused_token = self.consume_FUSEDTYPE()
         function_name = fused_token.value
-        
-        # Parse arguments
-        self.consume(TokenType.LPAREN)
-        self.skip_newlines()
-        args = []
-        while not self.match(TokenType.RPAREN):
-            args.append(self.parse_expression())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            elif not self.match(TokenType.RPAREN):
-                self.skip_newlines()
-        self.consume(TokenType.RPAREN)
-        
-        return FunctionCall(
-            function=function_name,
-            arguments=args,
-            line=fused_token.line,
-            column=fused_token.column
-        )       
+        args = self._parse_paren_arglist()
+        return _FunctionCall(fused_token.line, fused_token.column, function_name, args)
 
 
     def parse_lowlevel_type(self) -> LowLevelType:
@@ -1555,542 +1752,400 @@ class Parser:
         token = self.current_token
         type_name = token.value
         self.advance()
-        
-        # Map type names to sizes and signedness
-        type_info = {
-            'Byte': (1, False), 'Word': (2, False), 'DWord': (4, False), 'QWord': (8, False),
-            'UInt8': (1, False), 'UInt16': (2, False), 'UInt32': (4, False), 'UInt64': (8, False),
-            'Int8': (1, True), 'Int16': (2, True), 'Int32': (4, True), 'Int64': (8, True)
-        }
-        
-        size, signed = type_info.get(type_name, (1, False))
-        
-        return LowLevelType(
-            type_name=type_name,
-            size=size,
-            signed=signed,
-            line=token.line,
-            column=token.column
-        )
+        size, signed = _LOWLEVEL_TYPE_INFO.get(type_name, (1, False))
+        return _LowLevelType(token.line, token.column, type_name, signed, size)
 
     def parse_apply(self) -> Apply:
-        start_token = self.consume(TokenType.APPLY)
-        self.consume(TokenType.LPAREN)
-        self.skip_newlines()
+        start_token = self.consume_APPLY()
+        self.consume_LPAREN()
         function = self.parse_expression()
         arguments = []
-        while self.match(TokenType.COMMA):
-            self.consume(TokenType.COMMA)
-            self.skip_newlines()
+        types = self.types
+        while types[self.position] == _COMMA_VAL:
+            self.advance()
             arguments.append(self.parse_expression())
-        self.skip_newlines()
-        self.consume(TokenType.RPAREN)
-        return Apply(function=function, arguments=arguments,
-                    line=start_token.line, column=start_token.column)
+        self.consume_RPAREN()
+        return Apply(start_token.line, start_token.column, function, arguments)
 
     def parse_runmacro(self) -> RunMacro:
-        start_token = self.consume(TokenType.RUNMACRO)
+        start_token = self.consume_RUNMACRO()
         macro_path = self.parse_dotted_name()
-        self.consume(TokenType.LPAREN)
-        self.skip_newlines()
-        arguments = []
-        while not self.match(TokenType.RPAREN):
-            arguments.append(self.parse_expression())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            elif not self.match(TokenType.RPAREN):
-                self.skip_newlines()
-        self.consume(TokenType.RPAREN)
-        return RunMacro(macro_path=macro_path, arguments=arguments,
-                        line=start_token.line, column=start_token.column)
+        arguments = self._parse_paren_arglist()
+        return RunMacro(start_token.line, start_token.column, macro_path, arguments)
 
     def parse_identifier(self) -> Identifier:
         name = self.parse_dotted_name()
-        return Identifier(name=name, line=self.current_token.line, column=self.current_token.column)
+        return _Identifier(self.lines[self.position], self.columns[self.position], name)
 
     def parse_array_literal(self) -> ArrayLiteral:
-        start_token = self.consume(TokenType.LBRACKET)
-        self.skip_newlines()
+        start_token = self.consume_LBRACKET()
         elements = []
-        while not self.match(TokenType.RBRACKET):
-            elements.append(self.parse_expression())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            elif not self.match(TokenType.RBRACKET):
-                self.skip_newlines()
-        self.consume(TokenType.RBRACKET)
-        return ArrayLiteral(elements=elements, line=start_token.line, column=start_token.column)
+        elements_append = elements.append
+        types = self.types
+        while types[self.position] != _RBRACKET_VAL:
+            elements_append(self.parse_expression())
+            if types[self.position] == _COMMA_VAL:
+                self.advance()
+        self.consume_RBRACKET()
+        return ArrayLiteral(start_token.line, start_token.column, elements)
 
     def parse_map_literal(self) -> MapLiteral:
-        start_token = self.consume(TokenType.LBRACE)
-        self.skip_newlines()
+        start_token = self.consume_LBRACE()
         pairs = []
-        while not self.match(TokenType.RBRACE):
+        pairs_append = pairs.append
+        types = self.types
+        while types[self.position] != _RBRACE_VAL:
             key = self.parse_expression()
-            self.consume(TokenType.COLON)
-            self.skip_newlines()
+            self.consume_COLON()
             value = self.parse_expression()
-            pairs.append((key, value))
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-            elif not self.match(TokenType.RBRACKET):
-                self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        return MapLiteral(pairs=pairs, line=start_token.line, column=start_token.column)
+            pairs_append((key, value))
+            if types[self.position] == _COMMA_VAL:
+                self.advance()
+        self.consume_RBRACE()
+        return MapLiteral(start_token.line, start_token.column, pairs)
 
     def parse_unit(self) -> ASTNode:
         unit_token = self.current_token
         unit_type = unit_token.value
         self.advance()
-        unit_multipliers = {
-            'Bytes': 1,
-            'Kilobytes': 1024,
-            'Megabytes': 1024 * 1024,
-            'Gigabytes': 1024 * 1024 * 1024,
-            'Seconds': 1,
-            'Milliseconds': 0.001,
-            'Microseconds': 0.000001,
-            'Percent': 0.01,
-        }
-        return Identifier(name=unit_type, line=unit_token.line, column=unit_token.column)
+        return _Identifier(unit_token.line, unit_token.column, unit_type)
 
     def consume_vm_operation_name(self) -> str:
         """Consume VM operation name - accepts both IDENTIFIER and VM-specific tokens"""
-        if self.match(TokenType.IDENTIFIER):
-            return self.consume(TokenType.IDENTIFIER).value
-        elif self.match(TokenType.ALLOCATE):
-            return self.consume(TokenType.ALLOCATE).value
-        elif self.match(TokenType.DEALLOCATE):
-            return self.consume(TokenType.DEALLOCATE).value
-        elif self.match(TokenType.FLUSH):
-            return self.consume(TokenType.FLUSH).value
-        elif self.match(TokenType.FLUSHALL):
-            return self.consume(TokenType.FLUSHALL).value
-        elif self.match(TokenType.INVALIDATE):
-            return self.consume(TokenType.INVALIDATE).value
-        elif self.match(TokenType.GLOBAL):
-            return self.consume(TokenType.GLOBAL).value
-        else:
-            # Fallback - try to get the current token value
-            if self.current_token:
-                token = self.current_token
-                self.advance()
-                return token.value
-            else:
-                self.error("Expected VM operation name")
-    
-    
+        # Every accepted alternative - IDENTIFIER, the VM-specific keywords
+        # (Allocate, Flush, ...) and the historical any-token fallback - did
+        # the same thing: take the token's value and advance.
+        token = self.current_token
+        if token is None:
+            self.error("Expected VM operation name")
+        self.advance()
+        return token.value
+
+    # Type entry dispatch: FIRST(1) table keyed by type ordinal, resolved to
+    # direct callables at module bottom alongside the expression tables.
+    _TYPE_FIRST1 = {
+        **{tt: 'parse_simple_type' for tt in (
+            TokenType.INTEGER, TokenType.FLOATINGPOINT, TokenType.TEXT,
+            TokenType.BOOLEAN, TokenType.ADDRESS, TokenType.VOID,
+            TokenType.ANY,
+            # === Low-Level Types ===
+            TokenType.BYTE, TokenType.WORD, TokenType.DWORD, TokenType.QWORD,
+            TokenType.UINT8, TokenType.UINT16, TokenType.UINT32,
+            TokenType.UINT64, TokenType.INT8, TokenType.INT16,
+            TokenType.INT32, TokenType.INT64)},
+        TokenType.POINTER: 'parse_pointer_type',
+        TokenType.ARRAY: 'parse_array_type',
+        TokenType.MAP: 'parse_map_type',
+        TokenType.TUPLE: 'parse_tuple_type',
+        TokenType.RECORD: 'parse_record_type',
+        TokenType.OPTIONALTYPE: 'parse_optional_type',
+        TokenType.FUNCTION: 'parse_function_type',
+        TokenType.CONSTRAINEDTYPE: 'parse_constrained_type_expr',
+        TokenType.IDENTIFIER: 'parse_named_type',
+    }
+
+    @memoize_rule(_RULE_TYPE)
     def parse_type(self) -> TypeExpression:
-        if self.match(TokenType.INTEGER, TokenType.FLOATINGPOINT, TokenType.TEXT,
-                     TokenType.BOOLEAN, TokenType.ADDRESS, TokenType.VOID, TokenType.ANY):
-            type_token = self.current_token
-            self.advance()
-            return TypeExpression(base_type=type_token.value,
-                                 line=type_token.line, column=type_token.column)
-        # === NEW: Low-Level Type Parsing ===
-        elif self.match(TokenType.BYTE, TokenType.WORD, TokenType.DWORD, TokenType.QWORD,
-                       TokenType.UINT8, TokenType.UINT16, TokenType.UINT32, TokenType.UINT64,
-                       TokenType.INT8, TokenType.INT16, TokenType.INT32, TokenType.INT64):
-            type_token = self.current_token
-            self.advance()
-            return TypeExpression(base_type=type_token.value,
-                                 line=type_token.line, column=type_token.column)
-        elif self.match(TokenType.POINTER):
-            return self.parse_pointer_type()
-        elif self.match(TokenType.ARRAY):
-            return self.parse_array_type()
-        elif self.match(TokenType.MAP):
-            return self.parse_map_type()
-        elif self.match(TokenType.TUPLE):
-            return self.parse_tuple_type()
-        elif self.match(TokenType.RECORD):
-            return self.parse_record_type()
-        elif self.match(TokenType.OPTIONALTYPE):
-            return self.parse_optional_type()
-        elif self.match(TokenType.FUNCTION):
-            return self.parse_function_type()
-        elif self.match(TokenType.CONSTRAINEDTYPE):
-            return self.parse_constrained_type_expr()
-        elif self.match(TokenType.IDENTIFIER):
-            name = self.parse_dotted_name()
-            return TypeExpression(base_type=name,
-                                 line=self.current_token.line, column=self.current_token.column)
-        else:
+        handler = self._TYPE_FIRST1.get(self.types[self.position])
+        if handler is None:
             self.error("Expected type expression")
+        return handler(self)
+
+    def parse_simple_type(self) -> TypeExpression:
+        type_token = self.current_token
+        self.advance()
+        return _TypeExpression(type_token.line, type_token.column, type_token.value)
+
+    def parse_named_type(self) -> TypeExpression:
+        name = self.parse_dotted_name()
+        return _TypeExpression(self.lines[self.position], self.columns[self.position], name)
 
     def parse_pointer_type(self) -> TypeExpression:
         """Parse pointer type declarations"""
-        start_token = self.consume(TokenType.POINTER)
-        self.consume(TokenType.LBRACKET)
+        start_token = self.consume_POINTER()
+        self.consume_LBRACKET()
         pointed_type = self.parse_type()
-        self.consume(TokenType.RBRACKET)
-        return TypeExpression(base_type='Pointer', parameters=[pointed_type],
-                             line=start_token.line, column=start_token.column)
+        self.consume_RBRACKET()
+        return _TypeExpression(start_token.line, start_token.column, 'Pointer', [pointed_type])
 
     def parse_array_type(self) -> TypeExpression:
-        start_token = self.consume(TokenType.ARRAY)
-        self.consume(TokenType.LBRACKET)
+        start_token = self.consume_ARRAY()
+        self.consume_LBRACKET()
         element_type = self.parse_type()
         params = [element_type]
         if self.match(TokenType.COMMA):
-            self.consume(TokenType.COMMA)
-            size = self.consume(TokenType.NUMBER).value
-            params.append(Number(value=size, line=self.current_token.line,
-                                 column=self.current_token.column))
-        self.consume(TokenType.RBRACKET)
-        return TypeExpression(base_type='Array', parameters=params,
-                             line=start_token.line, column=start_token.column)
+            self.consume_COMMA()
+            size = self.consume_NUMBER().value
+            params.append(_Number(self.lines[self.position], self.columns[self.position], size))
+        self.consume_RBRACKET()
+        return _TypeExpression(start_token.line, start_token.column, 'Array', params)
 
     def parse_map_type(self) -> TypeExpression:
-        start_token = self.consume(TokenType.MAP)
-        self.consume(TokenType.LBRACKET)
+        start_token = self.consume_MAP()
+        self.consume_LBRACKET()
         key_type = self.parse_type()
-        self.consume(TokenType.COMMA)
+        self.consume_COMMA()
         value_type = self.parse_type()
-        self.consume(TokenType.RBRACKET)
-        return TypeExpression(base_type='Map', parameters=[key_type, value_type],
-                             line=start_token.line, column=start_token.column)
+        self.consume_RBRACKET()
+        return _TypeExpression(start_token.line, start_token.column, 'Map', [key_type, value_type])
+
+    def _parse_delimited(self, close_val: int, parse_element) -> list:
+        """Parse 'element (, element)*' up to the close ordinal (not consumed).
+
+        The shared element loop behind the parameterized type spellings;
+        close_val is a raw type ordinal so the per-element test is a single
+        array probe.
+        """
+        items = []
+        items_append = items.append
+        types = self.types
+        while types[self.position] != close_val:
+            items_append(parse_element())
+            if types[self.position] == _COMMA_VAL:
+                self.advance()
+        return items
 
     def parse_tuple_type(self) -> TypeExpression:
-        start_token = self.consume(TokenType.TUPLE)
-        self.consume(TokenType.LBRACKET)
-        types = []
-        while not self.match(TokenType.RBRACKET):
-            types.append(self.parse_type())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        self.consume(TokenType.RBRACKET)
-        return TypeExpression(base_type='Tuple', parameters=types,
-                             line=start_token.line, column=start_token.column)
-
-    def parse_record_type(self) -> TypeExpression:
-        start_token = self.consume(TokenType.RECORD)
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        fields = []
-        while not self.match(TokenType.RBRACE):
-            field_name = self.consume(TokenType.IDENTIFIER).value
-            self.consume(TokenType.COLON)
-            field_type = self.parse_type()
-            fields.append((field_name, field_type))
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        self.consume(TokenType.RBRACE)
-        return TypeExpression(base_type='Record', parameters=[TypeExpression(base_type=f[0], parameters=[f[1]]) for f in fields],
-                             line=start_token.line, column=start_token.column)
+        start_token = self.consume_TUPLE()
+        self.consume_LBRACKET()
+        types = self._parse_delimited(_RBRACKET_VAL, self.parse_type)
+        self.consume_RBRACKET()
+        return _TypeExpression(start_token.line, start_token.column, 'Tuple', types)
+
+    def parse_record_type(self) -> RecordTypeExpression:
+        start_token = self.consume_RECORD()
+        self.consume_LBRACE()
+        names = []
+        field_types = []
+        types = self.types
+        while types[self.position] != _RBRACE_VAL:
+            names.append(self.consume_IDENTIFIER().value)
+            self.consume_COLON()
+            field_types.append(self.parse_type())
+            if types[self.position] == _COMMA_VAL:
+                self.advance()
+        self.consume_RBRACE()
+        return RecordTypeExpression(start_token.line, start_token.column,
+                                    tuple(names), tuple(field_types))
 
     def parse_optional_type(self) -> TypeExpression:
-        start_token = self.consume(TokenType.OPTIONALTYPE)
-        self.consume(TokenType.LBRACKET)
+        start_token = self.consume_OPTIONALTYPE()
+        self.consume_LBRACKET()
         base_type = self.parse_type()
-        self.consume(TokenType.RBRACKET)
-        return TypeExpression(base_type='OptionalType', parameters=[base_type],
-                             line=start_token.line, column=start_token.column)
+        self.consume_RBRACKET()
+        return _TypeExpression(start_token.line, start_token.column, 'OptionalType', [base_type])
 
     def parse_function_type(self) -> TypeExpression:
-        start_token = self.consume(TokenType.FUNCTION)
-        self.consume(TokenType.LBRACKET)
-        input_types = []
-        while not self.match(TokenType.ARROW):
-            input_types.append(self.parse_type())
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        self.consume(TokenType.ARROW)
+        start_token = self.consume_FUNCTION()
+        self.consume_LBRACKET()
+        input_types = self._parse_delimited(_ARROW_RIGHT_VAL, self.parse_type)
+        self.consume_ARROW_RIGHT()
         output_type = self.parse_type()
-        self.consume(TokenType.RBRACKET)
-        return TypeExpression(base_type='Function',
-                             parameters=input_types + [output_type],
-                             line=start_token.line, column=start_token.column)
+        self.consume_RBRACKET()
+        return _TypeExpression(start_token.line, start_token.column, 'Function', input_types + [output_type])
 
     def parse_constrained_type_expr(self) -> TypeExpression:
-        start_token = self.consume(TokenType.CONSTRAINEDTYPE)
-        name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.EQUALS)
+        start_token = self.consume_CONSTRAINEDTYPE()
+        name = self.consume_IDENTIFIER().value
+        self.consume_EQUALS()
         base_type = self.parse_type()
-        self.consume(TokenType.WHERE)
-        self.consume(TokenType.LBRACE)
+        self.consume_WHERE()
+        self.consume_LBRACE()
         constraints = self.parse_expression()
-        self.consume(TokenType.RBRACE)
-        return TypeExpression(base_type='ConstrainedType', parameters=[base_type], constraints=constraints,
-                             line=start_token.line, column=start_token.column)
+        self.consume_RBRACE()
+        return _TypeExpression(start_token.line, start_token.column, 'ConstrainedType', [base_type], constraints)
 
     def parse_string_array(self) -> List[str]:
-        self.consume(TokenType.LBRACKET)
+        self.consume_LBRACKET()
         strings = []
         while not self.match(TokenType.RBRACKET):
             if self.match(TokenType.STRING):
-                strings.append(self.consume(TokenType.STRING).value)
+                strings.append(self.consume_STRING().value)
             else:
                 self.error("Expected string in array")
             if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        self.consume(TokenType.RBRACKET)
+                self.consume_COMMA()
+        self.consume_RBRACKET()
         return strings
 
     def parse_acronym_definitions(self) -> AcronymDefinitions:
         """Parse AcronymDefinitions with ENHANCED string operator semantics"""
-        start_token = self.consume(TokenType.IDENTIFIER)  # Consume "AcronymDefinitions"
-        self.skip_newlines()
-        self.consume(TokenType.LBRACE)
-        self.skip_newlines()
-        
+        start_token = self.consume_IDENTIFIER()  # Consume "AcronymDefinitions"
+        self.consume_LBRACE()
+
         definitions = {}
-        
+
         while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
-            if self.match(TokenType.RBRACE):
-                break
-                
             # Parse: ACRONYM = Value (ENHANCED: Value can be IDENTIFIER or STRING)
-            acronym = self.consume(TokenType.IDENTIFIER).value
+            acronym = self.consume_IDENTIFIER().value
             
             # Validate acronym is uppercase
             if not acronym.isupper():
-                self.error(f"Acronym '{acronym}' must be all uppercase")
+                self.error("Acronym '%s' must be all uppercase", acronym)
             
-            self.consume(TokenType.EQUALS)
+            self.consume_EQUALS()
             
             # LANGUAGE ENHANCEMENT: Support semantic string operator
             if self.match(TokenType.STRING):
                 # String literal: RG = "ResourceGlobal" (literal string expansion)
-                full_name = self.consume(TokenType.STRING).value
-                print(f"DEBUG: Acronym {acronym} -> STRING LITERAL: '{full_name}'")
+                full_name = self.consume_STRING().value
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Acronym %s -> STRING LITERAL: %r", acronym, full_name)
             elif self.match(TokenType.IDENTIFIER):
                 # Identifier reference: RG = ResourceGlobal (identifier reference)  
-                full_name = self.consume(TokenType.IDENTIFIER).value
-                print(f"DEBUG: Acronym {acronym} -> IDENTIFIER REF: {full_name}")
+                full_name = self.consume_IDENTIFIER().value
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Acronym %s -> IDENTIFIER REF: %s", acronym, full_name)
             else:
-                self.error(f"Expected string literal or identifier for acronym value, got {self.current_token.type.name if self.current_token else 'EOF'}")
+                self.error("Expected string literal or identifier for acronym value, got %s",
+                           _type_name(self.current_token))
             
             definitions[acronym] = full_name
-            
-            self.skip_newlines()
-            
+
             # Optional comma
             if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-        
-        self.consume(TokenType.RBRACE)
-        return AcronymDefinitions(definitions=definitions, 
-                                line=start_token.line, 
-                                column=start_token.column)
+                self.consume_COMMA()
+
+        self.consume_RBRACE()
+        return AcronymDefinitions(start_token.line, start_token.column, definitions)
         
         
         
 
     def parse_vm_operation(self) -> ASTNode:
         """Parse Virtual Memory operations"""
-        try:
-            if self.match(TokenType.PAGETABLE):
-                return self.parse_page_table_operation()
-            elif self.match(TokenType.VIRTUALMEMORY):
-                return self.parse_virtual_memory_operation()
-            elif self.match(TokenType.CACHE):
-                return self.parse_cache_operation()
-            elif self.match(TokenType.TLB):
-                return self.parse_tlb_operation()
-            elif self.match(TokenType.MEMORYBARRIER):
-                return self.parse_memory_barrier_operation()
+        # No try/except here: the sub-parsers report failures through
+        # self.error, which already carries line/column context; wrapping
+        # the dispatch only re-raised the same message with the position
+        # of the wrapper instead of the fault.
+        if self.match(TokenType.PAGETABLE):
+            return self.parse_page_table_operation()
+        elif self.match(TokenType.VIRTUALMEMORY):
+            return self.parse_virtual_memory_operation()
+        elif self.match(TokenType.CACHE):
+            return self.parse_cache_operation()
+        elif self.match(TokenType.TLB):
+            return self.parse_tlb_operation()
+        elif self.match(TokenType.MEMORYBARRIER):
+            return self.parse_memory_barrier_operation()
+        self.error("Unexpected VM operation token: %s", self.current_token.value)
+
+    def _parse_paren_pair_args(self) -> Tuple[List[str], List[ASTNode]]:
+        """Parse '( name-value (, name-value)* )' into parallel name/value lists.
+
+        The one shared pair loop behind the VM operations. Names stay plain
+        strings destined for VMOperationCall.keyword_names; no synthetic
+        String nodes are built. Both lists are pre-sized from the
+        matching-paren span: a pair is at least name-DASH-value plus its
+        separator, so the span never holds more than one pair per four
+        tokens.
+        """
+        open_pos = self.position
+        close = self.paren_match[open_pos]
+        estimate = (close - open_pos) // 4 if close > open_pos else 0
+        self.consume_LPAREN()
+        names: List[str] = [None] * estimate
+        values: List[ASTNode] = [None] * estimate
+        count = 0
+        types = self.types
+        pexpr = self.parse_expression
+        while types[self.position] != _RPAREN_VAL:
+            name = self.consume_IDENTIFIER().value
+            self.consume_DASH()
+            value = pexpr()
+            if count < estimate:
+                names[count] = name
+                values[count] = value
             else:
-                self.error(f"Unexpected VM operation token: {self.current_token.value}")
-        except Exception as e:
-            self.error(f"Failed to parse VM operation: {str(e)}")
-
-    # Add this helper method to the Parser class (around line 1400):
-
-    def consume_vm_operation_name(self) -> str:
-        """Consume VM operation name - accepts both IDENTIFIER and VM-specific tokens"""
-        if self.match(TokenType.IDENTIFIER):
-            return self.consume(TokenType.IDENTIFIER).value
-        elif self.match(TokenType.ALLOCATE):
-            return self.consume(TokenType.ALLOCATE).value
-        elif self.match(TokenType.DEALLOCATE):
-            return self.consume(TokenType.DEALLOCATE).value
-        elif self.match(TokenType.FLUSH):
-            return self.consume(TokenType.FLUSH).value
-        elif self.match(TokenType.FLUSHALL):
-            return self.consume(TokenType.FLUSHALL).value
-        elif self.match(TokenType.INVALIDATE):
-            return self.consume(TokenType.INVALIDATE).value
-        elif self.match(TokenType.GLOBAL):
-            return self.consume(TokenType.GLOBAL).value
-        else:
-            # Fallback - try to get the current token value
-            if self.current_token:
-                token = self.current_token
+                names.append(name)
+                values.append(value)
+            count += 1
+            if types[self.position] == _COMMA_VAL:
                 self.advance()
-                return token.value
-            else:
-                self.error("Expected VM operation name")
+        del names[count:]
+        del values[count:]
+        self.consume_RPAREN()
+        return names, values
 
-    # Update these VM parsing methods:
+    def parse_page_table_operation(self) -> VMOperationCall:
+        """Parse PageTable.* operations"""
+        start_token = self.consume_PAGETABLE()
+        operation = self.consume_vm_operation_name()
 
-    def parse_page_table_operation(self) -> FunctionCall:
-        """Parse PageTable.* operations as FunctionCall for now"""
-        start_token = self.consume(TokenType.PAGETABLE)
-        operation = self.consume_vm_operation_name()  # <-- CHANGED
-    
         # Create function name: PageTable.Create -> PageTable_Create
         function_name = f"PageTable_{operation}"
-    
-        self.consume(TokenType.LPAREN)
-    
-        # Parse arguments in AILANG style (param-value pairs)
-        arguments = []
-        while not self.match(TokenType.RPAREN):
-            param_name = self.consume(TokenType.IDENTIFIER).value
-            self.consume(TokenType.DASH)
-            param_value = self.parse_expression()
-        
-            # Store as a pair for now - we'll enhance this later
-            arguments.append(String(value=param_name, line=self.current_token.line, column=self.current_token.column))
-            arguments.append(param_value)
-        
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-    
-        self.consume(TokenType.RPAREN)
-    
-        return FunctionCall(
-            function=function_name,
-            arguments=arguments,
-            line=start_token.line,
-            column=start_token.column
-        )
-
-    def parse_virtual_memory_operation(self) -> FunctionCall:
-        """Parse VirtualMemory.* operations as FunctionCall"""
-        start_token = self.consume(TokenType.VIRTUALMEMORY)
-        operation = self.consume_vm_operation_name()  # <-- CHANGED
-    
+        names, values = self._parse_paren_pair_args()
+        return _VMOperationCall(start_token.line, start_token.column, function_name, names, values)
+
+    def parse_virtual_memory_operation(self) -> VMOperationCall:
+        """Parse VirtualMemory.* operations"""
+        start_token = self.consume_VIRTUALMEMORY()
+        operation = self.consume_vm_operation_name()
+
         function_name = f"VirtualMemory_{operation}"
-    
-        self.consume(TokenType.LPAREN)
-    
-        arguments = []
-        while not self.match(TokenType.RPAREN):
-            param_name = self.consume(TokenType.IDENTIFIER).value
-            self.consume(TokenType.DASH)
-            param_value = self.parse_expression()
-        
-            arguments.append(String(value=param_name, line=self.current_token.line, column=self.current_token.column))
-            arguments.append(param_value)
-        
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-    
-        self.consume(TokenType.RPAREN)
-    
-        return FunctionCall(
-            function=function_name,
-            arguments=arguments,
-            line=start_token.line,
-            column=start_token.column
-        )
-
-    def parse_cache_operation(self) -> FunctionCall:
-        """Parse Cache.* operations as FunctionCall"""
-        start_token = self.consume(TokenType.CACHE)
-        operation = self.consume_vm_operation_name()  # <-- CHANGED
-    
+        names, values = self._parse_paren_pair_args()
+        return _VMOperationCall(start_token.line, start_token.column, function_name, names, values)
+
+    def parse_cache_operation(self) -> VMOperationCall:
+        """Parse Cache.* operations"""
+        start_token = self.consume_CACHE()
+        operation = self.consume_vm_operation_name()
+
         function_name = f"Cache_{operation}"
-    
-        self.consume(TokenType.LPAREN)
-    
-        arguments = []
-        while not self.match(TokenType.RPAREN):
-            param_name = self.consume(TokenType.IDENTIFIER).value
-            self.consume(TokenType.DASH)
-            param_value = self.parse_expression()
-        
-            arguments.append(String(value=param_name, line=self.current_token.line, column=self.current_token.column))
-            arguments.append(param_value)
-        
-            if self.match(TokenType.COMMA):
-                self.consume(TokenType.COMMA)
-                self.skip_newlines()
-    
-        self.consume(TokenType.RPAREN)
-    
-        return FunctionCall(
-            function=function_name,
-            arguments=arguments,
-            line=start_token.line,
-            column=start_token.column
-        )
-
-    def parse_tlb_operation(self) -> FunctionCall:
-        """Parse TLB.* operations as FunctionCall"""
-        start_token = self.consume(TokenType.TLB)
-        operation = self.consume_vm_operation_name()  # <-- CHANGED
-    
+        names, values = self._parse_paren_pair_args()
+        return _VMOperationCall(start_token.line, start_token.column, function_name, names, values)
+
+    def parse_tlb_operation(self) -> VMOperationCall:
+        """Parse TLB.* operations"""
+        start_token = self.consume_TLB()
+        operation = self.consume_vm_operation_name()
+
         function_name = f"TLB_{operation}"
-    
+
         # Handle operations with or without parentheses
-        arguments = []
         if self.match(TokenType.LPAREN):
-            self.consume(TokenType.LPAREN)
-        
-            while not self.match(TokenType.RPAREN):
-                param_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.DASH)
-                param_value = self.parse_expression()
-            
-                arguments.append(String(value=param_name, line=self.current_token.line, column=self.current_token.column))
-                arguments.append(param_value)
-            
-                if self.match(TokenType.COMMA):
-                    self.consume(TokenType.COMMA)
-                    self.skip_newlines()
-        
-            self.consume(TokenType.RPAREN)
-    
-        return FunctionCall(
-            function=function_name,
-            arguments=arguments,
-            line=start_token.line,
-            column=start_token.column
-        )
-
-    def parse_memory_barrier_operation(self) -> FunctionCall:
-        """Parse MemoryBarrier.* operations as FunctionCall"""
-        start_token = self.consume(TokenType.MEMORYBARRIER)
-        barrier_type = self.consume_vm_operation_name()  # <-- CHANGED
-    
+            names, values = self._parse_paren_pair_args()
+        else:
+            names, values = [], []
+        return _VMOperationCall(start_token.line, start_token.column, function_name, names, values)
+
+    def parse_memory_barrier_operation(self) -> VMOperationCall:
+        """Parse MemoryBarrier.* operations"""
+        start_token = self.consume_MEMORYBARRIER()
+        barrier_type = self.consume_vm_operation_name()
+
         function_name = f"MemoryBarrier_{barrier_type}"
-    
+
         # Handle operations with or without parentheses
-        arguments = []
         if self.match(TokenType.LPAREN):
-            self.consume(TokenType.LPAREN)
-        
-            while not self.match(TokenType.RPAREN):
-                param_name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.DASH)
-                param_value = self.parse_expression()
-            
-                arguments.append(String(value=param_name, line=self.current_token.line, column=self.current_token.column))
-                arguments.append(param_value)
-            
-                if self.match(TokenType.COMMA):
-                    self.consume(TokenType.COMMA)
-                    self.skip_newlines()
-        
-            self.consume(TokenType.RPAREN)
-    
-        return FunctionCall(
-            function=function_name,
-            arguments=arguments,
-            line=start_token.line,
-            column=start_token.column
-        )
\ No newline at end of file
+            names, values = self._parse_paren_pair_args()
+        else:
+            names, values = [], []
+        return _VMOperationCall(start_token.line, start_token.column, function_name, names, values)
+
+# Resolve the dispatch-table method names to plain functions once at import;
+# parse-time dispatch is then a dict probe plus a direct call (no getattr).
+Parser._DECL_DISPATCH = {tt: getattr(Parser, name) for tt, name in Parser._DECL_DISPATCH.items()}
+Parser._STMT_DISPATCH = {tt: getattr(Parser, name) for tt, name in Parser._STMT_DISPATCH.items()}
+Parser._RES_ATTR_MAP = {tt: (key, getattr(Parser, name))
+                        for tt, (key, name) in Parser._RES_ATTR_MAP.items()}
+
+Parser._EXPR_FIRST1 = {tt.value: getattr(Parser, name)
+                       for tt, name in Parser._EXPR_FIRST1.items()}
+Parser._EXPR_FIRST2 = {(a.value, b.value): getattr(Parser, name)
+                       for (a, b), name in Parser._EXPR_FIRST2.items()}
+Parser._TYPE_FIRST1 = {tt.value: getattr(Parser, name)
+                       for tt, name in Parser._TYPE_FIRST1.items()}
+Parser._PRIMARY_DISPATCH = {tt.value: getattr(Parser, name)
+                            for tt, name in Parser._PRIMARY_DISPATCH.items()}
+_PRIMARY_DISPATCH = Parser._PRIMARY_DISPATCH
+
+# Module-level aliases for the expression FIRST tables: the strict-expression
+# hot path reads these as globals rather than instance attributes.
+_EXPR_FIRST1 = Parser._EXPR_FIRST1
+_EXPR_FIRST2 = Parser._EXPR_FIRST2
+
+# Specialized consume_<TOKEN> methods, one per token type.
+for _tt in TokenType:
+    setattr(Parser, f'consume_{_tt.name}', _make_consumer(_tt))
+del _tt
@@ -0,0 +1,73 @@
+# parser_cache.py - persistent on-disk AST cache keyed by source hash
+#
+# The language server re-parses unchanged files on every open/save. Parsed
+# Program nodes are pickled under ~/.cache/ailang_vscode/ast/ keyed by
+# SHA-256(source + parser version + interpreter version), so an unchanged
+# file skips the parser entirely on the next request. A stale or corrupt
+# entry just reads as a miss; invalidation is implicit in the hash.
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+# Bump when the AST shape or parser semantics change so old pickles miss.
+PARSER_VERSION = "2"
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ailang_vscode", "ast")
+
+hits = 0
+misses = 0
+
+
+def _cache_path(source: str) -> str:
+    h = hashlib.sha256()
+    h.update(source.encode("utf-8", "replace"))
+    h.update(PARSER_VERSION.encode("ascii"))
+    h.update(sys.version.encode("ascii", "replace"))
+    return os.path.join(CACHE_DIR, h.hexdigest() + ".pkl")
+
+
+def load(source: str):
+    """Return the cached AST for source, or None on a miss."""
+    global hits, misses
+    try:
+        with open(_cache_path(source), "rb") as f:
+            ast = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, IndexError):
+        misses += 1
+        return None
+    hits += 1
+    return ast
+
+
+# Declaration-level caches from the previous parse of each document, keyed
+# by URI and held in the server process only. An edit invalidates the
+# whole-file entry above, but unchanged top-level declarations still reparse
+# for free when the next Parser is seeded with the previous cache.
+_decl_caches: dict = {}
+
+
+def decl_cache(uri):
+    """Return the declaration cache from the last parse of uri, if any."""
+    return _decl_caches.get(uri)
+
+
+def store_decl_cache(uri, cache) -> None:
+    """Remember a parser's declaration cache for the next parse of uri."""
+    if cache:
+        _decl_caches[uri] = cache
+
+
+def store(source: str, ast) -> None:
+    """Pickle ast for source; written atomically, failures are ignored."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(ast, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _cache_path(source))
+    except (OSError, pickle.PicklingError):
+        pass
@@ -0,0 +1,48 @@
+# setup.py - OPTIONAL ahead-of-time build for the language tooling
+#
+# The VS Code extension runs lexer.py / parser.py / ailang_ast.py as plain
+# Python and nothing here is required for that. With Cython (or mypyc)
+# installed,
+#
+#     python setup.py build_ext --inplace
+#     AILANG_COMPILE_BACKEND=mypyc python setup.py build_ext --inplace
+#
+# compiles the same sources into extension modules next to them. Python
+# imports a compiled module in preference to the .py file, so the extension
+# transparently picks up C-level attribute access and call dispatch for the
+# token-at-a-time hot paths (match/advance/consume); deleting the built
+# artifacts falls straight back to pure Python.
+import os
+
+from setuptools import setup
+
+MODULES = ["lexer.py", "ailang_ast.py", "parser.py"]
+
+backend = os.environ.get("AILANG_COMPILE_BACKEND", "cython")
+if backend == "mypyc":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        raise SystemExit("mypy is not installed; the pure-Python modules work as-is.")
+    ext_modules = mypycify(MODULES)
+elif backend == "cython":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        raise SystemExit("Cython is not installed; the pure-Python modules work as-is.")
+    ext_modules = cythonize(
+        MODULES,
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+else:
+    raise SystemExit(f"Unknown AILANG_COMPILE_BACKEND {backend!r} (cython or mypyc).")
+
+setup(
+    name="ailang-language-support",
+    version="1.0.0",
+    ext_modules=ext_modules,
+)